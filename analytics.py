@@ -3,301 +3,566 @@ EpicWeaver Analytics Module - Analyzes team and voter patterns across all plots
 """
 
 import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to stdlib json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional - only used by the lite loader
+    ijson = None
+
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict
+from dataclasses import dataclass, field, asdict
+from itertools import combinations
 from datetime import datetime
 from typing import Dict, List, Any, Tuple
+import numpy as np
 import pandas as pd
 from league_system import LeagueSystem
 
 
+@dataclass(slots=True)
+class _TeamAccum:
+    """Per-team stats accumulator
+
+    A plain slotted struct instead of the old nested-lambda defaultdict
+    factory: cheaper to create, cheaper to access, and half the memory.
+    Field names match the keys of the public stats dict.
+    """
+    total_participations: int = 0
+    wins: int = 0
+    total_votes_received: int = 0
+    vote_history: List[int] = field(default_factory=list)
+    complexity_scores: List[int] = field(default_factory=list)
+    genre_performance: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    model_usage: Dict[str, int] = field(default_factory=dict)
+    win_rate: float = 0
+    avg_votes_per_round: float = 0
+    avg_complexity: float = 0
+
+
+@dataclass(slots=True)
+class _VoterAccum:
+    """Per-voter stats accumulator (see _TeamAccum)"""
+    total_votes_cast: int = 0
+    correct_predictions: int = 0
+    team_votes: Dict[str, int] = field(default_factory=dict)
+    model_usage: Dict[str, int] = field(default_factory=dict)
+    criteria_scores: Dict[str, List[int]] = field(default_factory=dict)
+    vote_history: List[Dict[str, Any]] = field(default_factory=list)
+    accuracy_rate: float = 0
+    avg_criteria_scores: Dict[str, float] = field(default_factory=dict)
+    favorite_team: str = 'None'
+
+
 class PlotAnalytics:
     """Analyzes plot data to extract team and voter insights"""
-    
-    def __init__(self, forge_dir: str = "forge"):
+
+    def __init__(self, forge_dir: str = "forge", lite: bool = False):
         self.forge_dir = Path(forge_dir)
+        self.lite = lite
         self.plots_data = []
         self.league_system = LeagueSystem()
+        self._stats_cache = None
+        self._stats_token = -1
         self._load_all_plots()
         self._update_league_standings()
-    
+
+    @staticmethod
+    def _load_one(file_path: str):
+        """Load and parse a single plot file, returning None on error"""
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            # orjson parses in C (~5x faster than stdlib) when available
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # Add metadata
+            file_name = os.path.basename(file_path)
+            data['_file_name'] = file_name
+            data['_file_path'] = file_path
+            # Extract timestamp from filename
+            timestamp_str = os.path.splitext(file_name)[0].split('_')[-1]
+            data['_timestamp'] = timestamp_str
+            # Truncated plot text used by several report views - one
+            # allocation here instead of one per loop iteration later
+            data['_plot_snippet'] = data['original_plot'][:50] + '...'
+            return data
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            return None
+
+    # Fields the analytics passes actually read; everything else
+    # (full plot text, expansions, selected_expansion) is dropped in
+    # lite mode to keep peak memory proportional to the numbers, not
+    # the prose
+    _LITE_FIELDS = ('genre', 'voting_results', 'processing_time',
+                    'all_expanded_plots', 'original_plot')
+
+    @classmethod
+    def _load_one_lite(cls, file_path: str):
+        """Load only the fields the stats need, returning None on error
+
+        With ijson installed the file is stream-decoded so the large
+        text payloads are never materialized; otherwise it falls back to
+        a full parse followed by projection.
+        """
+        try:
+            if ijson is not None:
+                data = {}
+                with open(file_path, 'rb') as f:
+                    for key, value in ijson.kvitems(f, ''):
+                        if key in cls._LITE_FIELDS:
+                            data[key] = value
+            else:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                full = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                data = {key: full[key] for key in cls._LITE_FIELDS if key in full}
+
+            # Keep only the numeric expansion fields the team stats use
+            data['all_expanded_plots'] = {
+                team: {'estimated_complexity': exp['estimated_complexity'],
+                       'model_used': exp.get('model_used', 'unknown')}
+                for team, exp in data['all_expanded_plots'].items()
+            }
+
+            # Same metadata as the full loader
+            file_name = os.path.basename(file_path)
+            data['_file_name'] = file_name
+            data['_file_path'] = file_path
+            data['_timestamp'] = os.path.splitext(file_name)[0].split('_')[-1]
+            data['_plot_snippet'] = data.pop('original_plot')[:50] + '...'
+            return data
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            return None
+
     def _load_all_plots(self):
         """Load all plot JSON files from forge directory"""
-        json_files = list(self.forge_dir.glob("plot_*.json"))
-        
-        for file_path in json_files:
+        # os.scandir is much cheaper than Path.glob at scale: no fnmatch
+        # translation, no Path objects for rejected entries, and the stat
+        # info needed for the cache manifest comes with the entry
+        json_files = []
+        manifest = {}  # (mtime, size) per file - the cache key for parsed plots
+        try:
+            with os.scandir(self.forge_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('plot_') and entry.name.endswith('.json'):
+                        stat = entry.stat()
+                        json_files.append(entry.path)
+                        manifest[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass  # No forge directory yet - nothing to load
+
+        # Reuse previously parsed plots whose files haven't changed.
+        # Lite mode skips the cache - it stores full payloads, which is
+        # exactly what lite mode exists to avoid holding
+        loader = self._load_one_lite if self.lite else self._load_one
+        cache_path = self.forge_dir / ".plots_cache.pkl"
+        cached = {}
+        if not self.lite and cache_path.exists():
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    # Add metadata
-                    data['_file_name'] = file_path.name
-                    data['_file_path'] = str(file_path)
-                    # Extract timestamp from filename
-                    timestamp_str = file_path.stem.split('_')[-1]
-                    data['_timestamp'] = timestamp_str
-                    self.plots_data.append(data)
-            except Exception as e:
-                print(f"Error loading {file_path}: {e}")
-        
+                with open(cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+            except Exception:
+                cached = {}  # Corrupt/stale cache - just re-parse everything
+
+        to_parse = []
+        for file_path in json_files:
+            entry = cached.get(file_path)
+            if entry is not None and entry[0] == manifest[file_path]:
+                data = entry[1]
+                # Caches written before this field existed lack it
+                if '_plot_snippet' not in data:
+                    data['_plot_snippet'] = data['original_plot'][:50] + '...'
+                self.plots_data.append(data)
+            else:
+                to_parse.append(file_path)
+
+        # Each file is independent, so overlap disk reads and parsing
+        # across a thread pool (orjson releases the GIL while parsing)
+        if to_parse:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for file_path, data in zip(to_parse, executor.map(loader, to_parse)):
+                    if data is not None:
+                        self.plots_data.append(data)
+                        if not self.lite:
+                            cached[file_path] = (manifest[file_path], data)
+
+            # Persist the refreshed cache (drop entries for deleted files)
+            if not self.lite:
+                try:
+                    cached = {path: entry for path, entry in cached.items() if path in manifest}
+                    with open(cache_path, 'wb') as f:
+                        pickle.dump(cached, f, protocol=5)
+                except Exception as e:
+                    print(f"Warning: could not write plots cache: {e}")
+
         # Sort by timestamp
         self.plots_data.sort(key=lambda x: x['_timestamp'], reverse=True)
-    
+
+        self._build_column_arrays()
+
+    def _build_column_arrays(self):
+        """Build columnar (SoA) arrays for the numeric plot data
+
+        The nested-dict plot payloads cost several hash lookups per value.
+        Interning team/voter names to int ids and laying the numbers out as
+        parallel ndarrays lets the stats aggregations run as typed array
+        reductions instead of dict traversals.
+        """
+        team_ids: Dict[str, int] = {}
+        voter_ids: Dict[str, int] = {}
+
+        t_plot_idx, t_team_id, t_votes, t_won, t_complexity = [], [], [], [], []
+        v_plot_idx, v_voter_id, v_voted_team_id, v_correct = [], [], [], []
+
+        for plot_idx, plot in enumerate(self.plots_data):
+            results = plot['voting_results']
+            vote_tally = results['vote_tally']
+            winning_team = results['winning_team']
+
+            for team_name, expansion in plot['all_expanded_plots'].items():
+                team_id = team_ids.setdefault(team_name, len(team_ids))
+                t_plot_idx.append(plot_idx)
+                t_team_id.append(team_id)
+                t_votes.append(vote_tally.get(team_name, 0))
+                t_won.append(team_name == winning_team)
+                t_complexity.append(expansion['estimated_complexity'])
+
+            for vote in results['individual_votes']:
+                voter_id = voter_ids.setdefault(vote['agent_name'], len(voter_ids))
+                voted_team = vote['vote_for_team']
+                v_plot_idx.append(plot_idx)
+                v_voter_id.append(voter_id)
+                v_voted_team_id.append(team_ids.setdefault(voted_team, len(team_ids)))
+                v_correct.append(voted_team == winning_team)
+
+        self._team_names = list(team_ids)
+        self._voter_names = list(voter_ids)
+        # Narrow dtypes: complexity is 1-10, votes/flags are tiny. Halving
+        # the element width halves the memory traffic of every reduction
+        # over these columns once the history grows large.
+        self._team_plot_idx = np.asarray(t_plot_idx, dtype=np.int32)
+        self._team_id = np.asarray(t_team_id, dtype=np.int32)
+        self._votes_received = np.asarray(t_votes, dtype=np.uint16)
+        self._won = np.asarray(t_won, dtype=np.uint8)
+        self._complexity = np.asarray(t_complexity, dtype=np.int16)
+        self._voter_plot_idx = np.asarray(v_plot_idx, dtype=np.int32)
+        self._voter_id = np.asarray(v_voter_id, dtype=np.int32)
+        self._voted_team_id = np.asarray(v_voted_team_id, dtype=np.int32)
+        self._is_correct = np.asarray(v_correct, dtype=np.uint8)
+
     def _update_league_standings(self):
-        """Update league standings based on all plots"""
+        """Update league standings with plots newer than the last processed one
+
+        The league file persists between runs, so replaying the full
+        history on every construction both wasted time and double-counted
+        results. A high-water mark (the newest processed plot timestamp)
+        is stored in the league data and only newer plots are fed in.
+        """
+        last_processed = self.league_system.league_data.get("last_processed", "")
+        newest = last_processed
+
         # Process each plot in chronological order for accurate standings
         for plot in reversed(self.plots_data):  # Process oldest first
+            if plot['_timestamp'] <= last_processed:
+                continue
             plot_id = plot['_file_name']
             self.league_system.update_team_result(plot_id, plot['voting_results'])
             self.league_system.update_voter_result(plot_id, plot['voting_results'])
-        
+            if plot['_timestamp'] > newest:
+                newest = plot['_timestamp']
+
         # Save updated standings
+        self.league_system.league_data["last_processed"] = newest
         self.league_system.save_league_data()
-    
-    def get_team_stats(self) -> Dict[str, Dict[str, Any]]:
-        """Calculate comprehensive team statistics"""
-        team_stats = defaultdict(lambda: {
-            'total_participations': 0,
-            'wins': 0,
-            'total_votes_received': 0,
-            'vote_history': [],
-            'complexity_scores': [],
-            'genre_performance': defaultdict(lambda: {'participations': 0, 'wins': 0}),
-            'model_usage': defaultdict(int)
-        })
-        
+
+    def _compute_all_stats(self) -> Dict[str, Any]:
+        """Compute team, voter, pattern and overall statistics in a single pass
+
+        Every stats method used to walk self.plots_data independently, so a
+        dashboard page calling all of them traversed the data four times.
+        One fused traversal feeds all the accumulators; the public methods
+        are thin views over the cached result.
+        """
+        token = len(self.plots_data)
+        if self._stats_cache is not None and self._stats_token == token:
+            return self._stats_cache
+
+        team_stats: Dict[str, _TeamAccum] = {}
+        voter_stats: Dict[str, _VoterAccum] = {}
+
+        patterns = {
+            'voting_blocs': defaultdict(list),
+            'contrarian_voters': [],
+            'consensus_voters': [],
+            'team_rivalries': defaultdict(lambda: defaultdict(int)),
+            'genre_preferences': defaultdict(lambda: defaultdict(int))
+        }
+
+        overall = {
+            'total_plots': len(self.plots_data),
+            'genres': defaultdict(int),
+            'models_used': defaultdict(int),
+            'processing_times': [],
+            'vote_distributions': [],
+            'complexity_distribution': []
+        }
+
+        # Rivalries accumulate into a team x team win matrix; one
+        # vectorized pairwise comparison per plot replaces the O(T^2)
+        # Python loop
+        team_index = {name: i for i, name in enumerate(self._team_names)}
+        rival_matrix = np.zeros((len(team_index), len(team_index)), dtype=np.int32)
+
+        # The single fused pass over all plots
         for plot in self.plots_data:
             genre = plot['genre']
-            winning_team = plot['voting_results']['winning_team']
-            vote_tally = plot['voting_results']['vote_tally']
-            
-            # Process each team's data
+            results = plot['voting_results']
+            winning_team = results['winning_team']
+            vote_tally = results['vote_tally']
+            votes = results['individual_votes']
+
+            # --- Team statistics ---
+            # (numeric aggregates come from the column arrays below; this
+            # loop only fills the dict/list-shaped fields)
             for team_name, expansion in plot['all_expanded_plots'].items():
-                stats = team_stats[team_name]
-                stats['total_participations'] += 1
-                
-                # Track votes
-                votes_received = vote_tally.get(team_name, 0)
-                stats['total_votes_received'] += votes_received
-                stats['vote_history'].append(votes_received)
-                
-                # Track wins
+                stats = team_stats.get(team_name)
+                if stats is None:
+                    stats = team_stats[team_name] = _TeamAccum()
+                stats.vote_history.append(vote_tally.get(team_name, 0))
+
+                # Track genre performance
+                genre_perf = stats.genre_performance.get(genre)
+                if genre_perf is None:
+                    genre_perf = stats.genre_performance[genre] = {'participations': 0, 'wins': 0}
                 if team_name == winning_team:
-                    stats['wins'] += 1
-                    stats['genre_performance'][genre]['wins'] += 1
-                
+                    genre_perf['wins'] += 1
+                genre_perf['participations'] += 1
+
                 # Track complexity
-                stats['complexity_scores'].append(expansion['estimated_complexity'])
-                
-                # Track genre participation
-                stats['genre_performance'][genre]['participations'] += 1
-                
+                stats.complexity_scores.append(expansion['estimated_complexity'])
+
                 # Track model usage
                 model_used = expansion.get('model_used', 'unknown')
-                stats['model_usage'][model_used] += 1
-        
-        # Calculate derived statistics
-        for team_name, stats in team_stats.items():
-            if stats['total_participations'] > 0:
-                stats['win_rate'] = (stats['wins'] / stats['total_participations']) * 100
-                stats['avg_votes_per_round'] = stats['total_votes_received'] / stats['total_participations']
-                stats['avg_complexity'] = sum(stats['complexity_scores']) / len(stats['complexity_scores'])
-            else:
-                stats['win_rate'] = 0
-                stats['avg_votes_per_round'] = 0
-                stats['avg_complexity'] = 0
-        
-        return dict(team_stats)
-    
-    def get_voter_stats(self) -> Dict[str, Dict[str, Any]]:
-        """Calculate comprehensive voter statistics"""
-        voter_stats = defaultdict(lambda: {
-            'total_votes_cast': 0,
-            'correct_predictions': 0,
-            'team_votes': defaultdict(int),
-            'model_usage': defaultdict(int),
-            'criteria_scores': defaultdict(list),
-            'vote_history': []
-        })
-        
-        for plot in self.plots_data:
-            winning_team = plot['voting_results']['winning_team']
-            
-            for vote in plot['voting_results']['individual_votes']:
+                stats.model_usage[model_used] = stats.model_usage.get(model_used, 0) + 1
+                overall['models_used'][model_used] += 1
+
+                # Complexity distribution
+                overall['complexity_distribution'].append(expansion['estimated_complexity'])
+
+            # --- Voter statistics ---
+            for vote in votes:
                 voter_name = vote['agent_name']
                 voted_for = vote['vote_for_team']
-                
-                stats = voter_stats[voter_name]
-                stats['total_votes_cast'] += 1
-                stats['team_votes'][voted_for] += 1
-                
-                # Track accuracy
-                if voted_for == winning_team:
-                    stats['correct_predictions'] += 1
-                
+
+                stats = voter_stats.get(voter_name)
+                if stats is None:
+                    stats = voter_stats[voter_name] = _VoterAccum()
+                stats.team_votes[voted_for] = stats.team_votes.get(voted_for, 0) + 1
+
                 # Track model usage
                 model_used = vote.get('model_used', 'unknown')
-                stats['model_usage'][model_used] += 1
-                
+                stats.model_usage[model_used] = stats.model_usage.get(model_used, 0) + 1
+                overall['models_used'][model_used] += 1
+
                 # Track criteria scores
                 if 'score_breakdown' in vote:
                     for criterion, score in vote['score_breakdown'].items():
-                        stats['criteria_scores'][criterion].append(score)
-                
+                        stats.criteria_scores.setdefault(criterion, []).append(score)
+
                 # Track vote history
-                stats['vote_history'].append({
-                    'genre': plot['genre'],
+                stats.vote_history.append({
+                    'genre': genre,
                     'voted_for': voted_for,
                     'won': voted_for == winning_team,
                     'timestamp': plot['_timestamp']
                 })
-        
-        # Calculate derived statistics
-        for voter_name, stats in voter_stats.items():
-            if stats['total_votes_cast'] > 0:
-                stats['accuracy_rate'] = (stats['correct_predictions'] / stats['total_votes_cast']) * 100
-                
-                # Calculate average criteria scores
-                stats['avg_criteria_scores'] = {}
-                for criterion, scores in stats['criteria_scores'].items():
-                    if scores:
-                        stats['avg_criteria_scores'][criterion] = sum(scores) / len(scores)
-                
-                # Find favorite team
-                if stats['team_votes']:
-                    stats['favorite_team'] = max(stats['team_votes'], key=stats['team_votes'].get)
-            else:
-                stats['accuracy_rate'] = 0
-                stats['avg_criteria_scores'] = {}
-                stats['favorite_team'] = 'None'
-        
-        return dict(voter_stats)
-    
-    def get_voting_patterns(self) -> Dict[str, Any]:
-        """Analyze voting patterns and relationships"""
-        patterns = {
-            'voting_blocs': defaultdict(list),
-            'contrarian_voters': [],
-            'consensus_voters': [],
-            'team_rivalries': defaultdict(lambda: defaultdict(int)),
-            'genre_preferences': defaultdict(lambda: defaultdict(int))
-        }
-        
-        # Analyze each plot's voting patterns
-        for plot in self.plots_data:
-            votes = plot['voting_results']['individual_votes']
-            winning_team = plot['voting_results']['winning_team']
-            genre = plot['genre']
-            
+
+                # Genre preferences
+                patterns['genre_preferences'][voter_name][genre] += 1
+
+            # --- Voting patterns ---
             # Group voters by their choice
             vote_groups = defaultdict(list)
             for vote in votes:
                 vote_groups[vote['vote_for_team']].append(vote['agent_name'])
-            
-            # Track voting blocs (voters who voted together)
+
+            # Track voting blocs (voters who voted together) - combinations()
+            # enumerates the pairs in C, and the record is identical for
+            # every pair in a group so it is built once and shared
             for team, voters in vote_groups.items():
                 if len(voters) > 1:
-                    for i in range(len(voters)):
-                        for j in range(i + 1, len(voters)):
-                            bloc_key = tuple(sorted([voters[i], voters[j]]))
-                            patterns['voting_blocs'][bloc_key].append({
-                                'plot': plot['original_plot'][:50] + '...',
-                                'team': team,
-                                'genre': genre
-                            })
-            
-            # Track team rivalries (head-to-head performance)
-            vote_tally = plot['voting_results']['vote_tally']
-            teams = list(vote_tally.keys())
-            for i in range(len(teams)):
-                for j in range(i + 1, len(teams)):
-                    if vote_tally[teams[i]] > vote_tally[teams[j]]:
-                        patterns['team_rivalries'][teams[i]][teams[j]] += 1
-                    elif vote_tally[teams[j]] > vote_tally[teams[i]]:
-                        patterns['team_rivalries'][teams[j]][teams[i]] += 1
-            
-            # Track genre preferences
-            for vote in votes:
-                patterns['genre_preferences'][vote['agent_name']][genre] += 1
-        
-        # Identify contrarian and consensus voters
-        voter_stats = self.get_voter_stats()
+                    record = {
+                        'plot': plot['_plot_snippet'],
+                        'team': team,
+                        'genre': genre
+                    }
+                    for a, b in combinations(voters, 2):
+                        # Direct min/max ordering - no list+sort per pair
+                        bloc_key = (a, b) if a < b else (b, a)
+                        patterns['voting_blocs'][bloc_key].append(record)
+
+            # Track team rivalries (head-to-head performance): compare
+            # every tally against every other in one vectorized step
+            if vote_tally:
+                ids = np.fromiter((team_index[t] for t in vote_tally),
+                                  dtype=np.int32, count=len(vote_tally))
+                counts = np.fromiter(vote_tally.values(),
+                                     dtype=np.int32, count=len(vote_tally))
+                beat = counts[:, None] > counts[None, :]
+                winners, losers = np.nonzero(beat)
+                np.add.at(rival_matrix, (ids[winners], ids[losers]), 1)
+
+            # --- Overall statistics ---
+            overall['genres'][genre] += 1
+
+            if 'processing_time' in plot:
+                overall['processing_times'].append(plot['processing_time'])
+
+            total_votes = results['total_votes']
+            if total_votes > 0:
+                vote_percentages = [v/total_votes * 100 for v in vote_tally.values()]
+                overall['vote_distributions'].extend(vote_percentages)
+
+        # --- Derived team statistics (aggregated in C via groupby) ---
+        # Built from a dict of 1D arrays so every column keeps its own
+        # contiguous buffer (effectively column-major) - constructing from
+        # a row-major 2D array makes groupby dramatically slower at scale
+        if self._team_id.size:
+            teams_df = pd.DataFrame({
+                'team': self._team_id,
+                'votes_received': self._votes_received,
+                'won': self._won,
+                'complexity': self._complexity,
+            }, copy=False)
+            team_agg = teams_df.groupby('team').agg(
+                participations=('team', 'size'),
+                wins=('won', 'sum'),
+                total_votes=('votes_received', 'sum'),
+                avg_complexity=('complexity', 'mean'),
+            )
+            for team_id, row in team_agg.iterrows():
+                stats = team_stats[self._team_names[team_id]]
+                stats.total_participations = int(row['participations'])
+                stats.wins = int(row['wins'])
+                stats.total_votes_received = int(row['total_votes'])
+                stats.win_rate = float(row['wins'] / row['participations']) * 100
+                stats.avg_votes_per_round = float(row['total_votes'] / row['participations'])
+                stats.avg_complexity = float(row['avg_complexity'])
+
+        # --- Derived voter statistics (aggregated in C via groupby) ---
+        if self._voter_id.size:
+            voters_df = pd.DataFrame({
+                'voter': self._voter_id,
+                'correct': self._is_correct,
+            }, copy=False)
+            voter_agg = voters_df.groupby('voter').agg(
+                votes_cast=('voter', 'size'),
+                correct=('correct', 'sum'),
+            )
+            for voter_id, row in voter_agg.iterrows():
+                stats = voter_stats[self._voter_names[voter_id]]
+                stats.total_votes_cast = int(row['votes_cast'])
+                stats.correct_predictions = int(row['correct'])
+                stats.accuracy_rate = float(row['correct'] / row['votes_cast']) * 100
+
+        # Favorite teams via a voter x team count matrix - argmax is a
+        # single C scan per voter instead of a Python max() over dict keys
+        if self._voter_id.size:
+            vote_counts = np.zeros((len(self._voter_names), len(self._team_names)), dtype=np.int32)
+            np.add.at(vote_counts, (self._voter_id, self._voted_team_id), 1)
+            favorites = vote_counts.argmax(axis=1)
+            for voter_id, voter_name in enumerate(self._voter_names):
+                if vote_counts[voter_id].any():
+                    voter_stats[voter_name].favorite_team = self._team_names[favorites[voter_id]]
+
+        for voter_name, stats in voter_stats.items():
+            # Calculate average criteria scores
+            for criterion, scores in stats.criteria_scores.items():
+                if scores:
+                    stats.avg_criteria_scores[criterion] = float(np.mean(scores))
+
+        # --- Contrarian and consensus voters (reuses the stats computed above) ---
         for voter_name, stats in voter_stats.items():
-            if stats['accuracy_rate'] < 30 and stats['total_votes_cast'] >= 5:
+            if stats.accuracy_rate < 30 and stats.total_votes_cast >= 5:
                 patterns['contrarian_voters'].append({
                     'name': voter_name,
-                    'accuracy': stats['accuracy_rate'],
-                    'votes_cast': stats['total_votes_cast']
+                    'accuracy': stats.accuracy_rate,
+                    'votes_cast': stats.total_votes_cast
                 })
-            elif stats['accuracy_rate'] > 70 and stats['total_votes_cast'] >= 5:
+            elif stats.accuracy_rate > 70 and stats.total_votes_cast >= 5:
                 patterns['consensus_voters'].append({
                     'name': voter_name,
-                    'accuracy': stats['accuracy_rate'],
-                    'votes_cast': stats['total_votes_cast']
+                    'accuracy': stats.accuracy_rate,
+                    'votes_cast': stats.total_votes_cast
                 })
-        
+
+        # Convert the rivalry matrix back to the nested dict shape
+        for winner_id, loser_id in zip(*np.nonzero(rival_matrix)):
+            winner = self._team_names[winner_id]
+            loser = self._team_names[loser_id]
+            patterns['team_rivalries'][winner][loser] = int(rival_matrix[winner_id, loser_id])
+
         # Convert defaultdicts to regular dicts for JSON serialization
         patterns['voting_blocs'] = dict(patterns['voting_blocs'])
         patterns['team_rivalries'] = {k: dict(v) for k, v in patterns['team_rivalries'].items()}
         patterns['genre_preferences'] = {k: dict(v) for k, v in patterns['genre_preferences'].items()}
-        
-        return patterns
-    
+
+        # --- Derived overall statistics (numpy reductions instead of
+        # Python sum()/len() over boxed values) ---
+        if overall['processing_times']:
+            overall['avg_processing_time'] = float(np.mean(overall['processing_times']))
+        else:
+            overall['avg_processing_time'] = 0
+
+        # The complexity column array holds the same values the
+        # distribution list was built from
+        overall['avg_complexity'] = float(self._complexity.mean()) if self._complexity.size else 0
+
+        overall['genres'] = dict(overall['genres'])
+        overall['models_used'] = dict(overall['models_used'])
+
+        self._stats_cache = {
+            # The accumulators are converted to plain dicts only at the
+            # API boundary (field names match the historical dict keys)
+            'team_stats': {name: asdict(acc) for name, acc in team_stats.items()},
+            'voter_stats': {name: asdict(acc) for name, acc in voter_stats.items()},
+            'patterns': patterns,
+            'overall': overall
+        }
+        self._stats_token = token
+        return self._stats_cache
+
+    def get_team_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Calculate comprehensive team statistics"""
+        return self._compute_all_stats()['team_stats']
+
+    def get_voter_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Calculate comprehensive voter statistics
+
+        Served from the fused-pass cache, so calling this alongside
+        get_voting_patterns() never triggers a second traversal.
+        """
+        return self._compute_all_stats()['voter_stats']
+
+    def get_voting_patterns(self) -> Dict[str, Any]:
+        """Analyze voting patterns and relationships"""
+        return self._compute_all_stats()['patterns']
+
     def get_overall_statistics(self) -> Dict[str, Any]:
         """Calculate system-wide statistics"""
-        stats = {
-            'total_plots': len(self.plots_data),
-            'genres': defaultdict(int),
-            'models_used': defaultdict(int),
-            'processing_times': [],
-            'vote_distributions': [],
-            'complexity_distribution': []
-        }
-        
-        for plot in self.plots_data:
-            # Genre distribution
-            stats['genres'][plot['genre']] += 1
-            
-            # Processing times
-            if 'processing_time' in plot:
-                stats['processing_times'].append(plot['processing_time'])
-            
-            # Vote distributions
-            total_votes = plot['voting_results']['total_votes']
-            vote_tally = plot['voting_results']['vote_tally']
-            if total_votes > 0:
-                vote_percentages = [votes/total_votes * 100 for votes in vote_tally.values()]
-                stats['vote_distributions'].extend(vote_percentages)
-            
-            # Model usage across all teams and voters
-            for expansion in plot['all_expanded_plots'].values():
-                model = expansion.get('model_used', 'unknown')
-                stats['models_used'][model] += 1
-            
-            for vote in plot['voting_results']['individual_votes']:
-                model = vote.get('model_used', 'unknown')
-                stats['models_used'][model] += 1
-            
-            # Complexity distribution
-            for expansion in plot['all_expanded_plots'].values():
-                stats['complexity_distribution'].append(expansion['estimated_complexity'])
-        
-        # Calculate averages
-        if stats['processing_times']:
-            stats['avg_processing_time'] = sum(stats['processing_times']) / len(stats['processing_times'])
-        else:
-            stats['avg_processing_time'] = 0
-        
-        if stats['complexity_distribution']:
-            stats['avg_complexity'] = sum(stats['complexity_distribution']) / len(stats['complexity_distribution'])
-        else:
-            stats['avg_complexity'] = 0
-        
-        # Convert defaultdicts
-        stats['genres'] = dict(stats['genres'])
-        stats['models_used'] = dict(stats['models_used'])
-        
-        return stats
-    
+        return self._compute_all_stats()['overall']
+
     def get_team_head_to_head(self, team1: str, team2: str) -> Dict[str, Any]:
         """Get head-to-head statistics between two teams"""
         h2h = {
@@ -309,62 +574,95 @@ class PlotAnalytics:
             'vote_comparison': [],
             'genre_breakdown': defaultdict(lambda: {'team1_wins': 0, 'team2_wins': 0, 'encounters': 0})
         }
-        
+
         for plot in self.plots_data:
-            if team1 in plot['all_expanded_plots'] and team2 in plot['all_expanded_plots']:
+            expanded = plot['all_expanded_plots']
+            if team1 in expanded and team2 in expanded:
                 h2h['total_encounters'] += 1
-                
-                vote_tally = plot['voting_results']['vote_tally']
-                team1_votes = vote_tally.get(team1, 0)
-                team2_votes = vote_tally.get(team2, 0)
-                
+
+                results = plot['voting_results']
+                vote_tally = results['vote_tally']
+                winner = results['winning_team']
+                genre = plot['genre']
+
                 h2h['vote_comparison'].append({
-                    'plot': plot['original_plot'][:50] + '...',
-                    'genre': plot['genre'],
-                    'team1_votes': team1_votes,
-                    'team2_votes': team2_votes,
-                    'winner': plot['voting_results']['winning_team']
+                    'plot': plot['_plot_snippet'],
+                    'genre': genre,
+                    'team1_votes': vote_tally.get(team1, 0),
+                    'team2_votes': vote_tally.get(team2, 0),
+                    'winner': winner
                 })
-                
-                genre = plot['genre']
+
                 h2h['genre_breakdown'][genre]['encounters'] += 1
-                
-                if plot['voting_results']['winning_team'] == team1:
+
+                if winner == team1:
                     h2h['team1_wins'] += 1
                     h2h['genre_breakdown'][genre]['team1_wins'] += 1
-                elif plot['voting_results']['winning_team'] == team2:
+                elif winner == team2:
                     h2h['team2_wins'] += 1
                     h2h['genre_breakdown'][genre]['team2_wins'] += 1
-        
+
         # Convert defaultdict
         h2h['genre_breakdown'] = dict(h2h['genre_breakdown'])
-        
+
         return h2h
-    
+
     def get_timeline_data(self) -> List[Dict[str, Any]]:
         """Get data organized by timeline for trend analysis"""
         timeline = []
-        
+
         for plot in self.plots_data:
+            results = plot['voting_results']
             timeline.append({
                 'timestamp': plot['_timestamp'],
                 'genre': plot['genre'],
-                'winner': plot['voting_results']['winning_team'],
-                'total_votes': plot['voting_results']['total_votes'],
+                'winner': results['winning_team'],
+                'total_votes': results['total_votes'],
                 'processing_time': plot.get('processing_time', 0),
-                'vote_distribution': plot['voting_results']['vote_tally']
+                'vote_distribution': results['vote_tally']
             })
-        
+
         return timeline
-    
+
     def get_team_league_table(self) -> List[Dict[str, Any]]:
         """Get team league table from league system"""
         return self.league_system.get_team_league_table()
-    
+
     def get_voter_league_table(self) -> List[Dict[str, Any]]:
         """Get voter league table from league system"""
         return self.league_system.get_voter_league_table()
-    
+
     def get_fairness_report(self) -> Dict[str, Any]:
         """Get fairness and bias analysis report"""
-        return self.league_system.get_fairness_report()
\ No newline at end of file
+        return self.league_system.get_fairness_report()
+
+
+# Shared instance cache - keyed by forge dir, refreshed when the newest
+# plot file changes so repeated dashboard calls don't rebuild everything
+_analytics_cache: Dict[str, Tuple[int, PlotAnalytics]] = {}
+
+
+def get_analytics(forge_dir: str = "forge") -> PlotAnalytics:
+    """Return a shared PlotAnalytics instance for a forge directory
+
+    The instance is rebuilt only when the newest plot file's mtime (or
+    the file count) changes, so callers can use this freely instead of
+    constructing PlotAnalytics per request.
+    """
+    newest = 0
+    count = 0
+    try:
+        with os.scandir(forge_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('plot_') and entry.name.endswith('.json'):
+                    count += 1
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > newest:
+                        newest = mtime
+    except FileNotFoundError:
+        pass
+
+    cached = _analytics_cache.get(forge_dir)
+    if cached is None or cached[0] != (newest, count):
+        _analytics_cache[forge_dir] = ((newest, count), PlotAnalytics(forge_dir))
+    return _analytics_cache[forge_dir][1]
@@ -0,0 +1,244 @@
+"""
+OpenAI Batch API mode for EpicWeaver
+For catalogs of hundreds of plots: ~50% cost of online pricing and
+throughput above the RPM ceiling, at the cost of up to 24h per stage
+"""
+
+import inspect
+import json
+import time
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Dict, List, Tuple
+
+from config import config
+from schemas import ExpandedPlotProposal, PlotExpanderOutput, VotingResult, VotingResults
+from voters.base_voter import BaseVoter, _ballot_schema
+from voting_strategies import StandardVoting
+
+
+class BatchRunner:
+    """Runs the expand-and-vote pipeline through the OpenAI Batch API
+
+    Every prompt the pipeline would issue is precomputed into a JSONL
+    batch with deterministic custom_ids ("plot_id|stage|agent"). Votes
+    depend on expansion outputs, so the run is two batch jobs: one for
+    all team expansions, then one for all voter ballots. Results are
+    demuxed by custom_id and stitched into PlotExpanderOutputs with
+    the same tally/tie-break/summary logic as the online path.
+    """
+
+    def __init__(self, team_manager, poll_interval: float = 60.0):
+        from openai import OpenAI
+        self.client = OpenAI()
+        self.team_manager = team_manager
+        self.poll_interval = poll_interval
+
+    def run(self, plot_list: List[Tuple[str, str]],
+            plot_ids: Dict[str, Tuple[str, str]]) -> List[PlotExpanderOutput]:
+        """Process the whole catalog; plot_ids maps plot_id -> (genre, plot)"""
+        start_time = datetime.now()
+
+        # Stage 1: every team expands every plot
+        print(f"\n📦 Batch stage 1: {len(plot_ids)} plots × "
+              f"{len(self.team_manager.expansion_teams)} teams...")
+        expansion_requests = self._build_expansion_requests(plot_ids)
+        expansion_responses = self._run_batch(expansion_requests)
+        all_expansions = self._demux_expansions(expansion_responses, plot_ids)
+
+        # Stage 2: the council votes on each plot's expansions
+        voters = self._voting_roster()
+        print(f"\n📦 Batch stage 2: votes from {len(voters)} agents...")
+        vote_requests = self._build_vote_requests(all_expansions, voters)
+        vote_responses = self._run_batch(vote_requests)
+
+        # Stitch outputs
+        outputs = []
+        strategy = StandardVoting()
+        for plot_id, (genre, plot) in plot_ids.items():
+            expansions = all_expansions.get(plot_id)
+            if not expansions:
+                print(f"⚠ No expansions for {plot_id}, skipping")
+                continue
+            voting_results = self._tally_votes(plot_id, expansions, voters,
+                                               vote_responses, strategy)
+            winning_expansion = expansions[voting_results.winning_team]
+            outputs.append(PlotExpanderOutput(
+                original_plot=plot,
+                genre=genre,
+                all_expanded_plots=expansions,
+                voting_results=voting_results,
+                selected_expansion=winning_expansion.model_dump(),
+                timestamp=start_time.isoformat(),
+                processing_time=(datetime.now() - start_time).total_seconds()
+            ))
+        return outputs
+
+    def _voting_roster(self) -> List[Any]:
+        """Voting agents with the same odd-count adjustment as online voting"""
+        voters = list(self.team_manager.voting_agents.values())
+        if config.get_team_count_limits().get("require_odd_voters", True):
+            if len(voters) % 2 == 0 and len(voters) > 1:
+                voters = voters[:-1]
+        return voters
+
+    def _build_expansion_requests(self, plot_ids: Dict[str, Tuple[str, str]]) -> List[dict]:
+        """One chat-completions request per (plot, team)"""
+        requests = []
+        schema = ExpandedPlotProposal.model_json_schema()
+        for plot_id, (genre, plot) in plot_ids.items():
+            for team_name, team in self.team_manager.expansion_teams.items():
+                requests.append({
+                    "custom_id": f"{plot_id}|expand|{team_name}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": team.model_name,
+                        "temperature": team.temperature,
+                        "messages": [{"role": "user",
+                                      "content": team._build_prompt(genre, plot)}],
+                        "response_format": {
+                            "type": "json_schema",
+                            "json_schema": {"name": "ExpandedPlotProposal",
+                                            "schema": schema}
+                        }
+                    }
+                })
+        return requests
+
+    def _build_vote_requests(self,
+                             all_expansions: Dict[str, Dict[str, ExpandedPlotProposal]],
+                             voters: List[Any]) -> List[dict]:
+        """One chat-completions request per (plot, voter)"""
+        requests = []
+        for plot_id, expansions in all_expansions.items():
+            if not expansions:
+                continue
+            blocks = BaseVoter.format_expansion_blocks(expansions)
+            schema = _ballot_schema(tuple(sorted(expansions.keys()))).model_json_schema()
+            for voter in voters:
+                requests.append({
+                    "custom_id": f"{plot_id}|vote|{voter.name}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": voter.model_name,
+                        "temperature": voter.temperature,
+                        "messages": [{"role": "user",
+                                      "content": voter.build_vote_prompt(expansions, blocks)}],
+                        "response_format": {
+                            "type": "json_schema",
+                            "json_schema": {"name": "VoteBallot", "schema": schema}
+                        }
+                    }
+                })
+        return requests
+
+    def _run_batch(self, requests: List[dict]) -> Dict[str, dict]:
+        """Submit a JSONL batch, poll to completion, return custom_id -> body"""
+        payload = "\n".join(json.dumps(r) for r in requests).encode('utf-8')
+        batch_file = self.client.files.create(
+            file=("epicweaver_batch.jsonl", BytesIO(payload)),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"  Submitted batch {batch.id} ({len(requests)} requests)")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(self.poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            counts = getattr(batch, 'request_counts', None)
+            done = getattr(counts, 'completed', '?') if counts else '?'
+            print(f"  Batch {batch.id}: {batch.status} ({done}/{len(requests)} done)")
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        responses = {}
+        content = self.client.files.content(batch.output_file_id).text
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                responses[entry["custom_id"]] = response["body"]
+            else:
+                print(f"  ⚠ {entry['custom_id']} failed: {entry.get('error')}")
+        return responses
+
+    def _demux_expansions(self, responses: Dict[str, dict],
+                          plot_ids: Dict[str, Tuple[str, str]]) -> Dict[str, Dict[str, ExpandedPlotProposal]]:
+        """Group expansion responses back into per-plot dicts"""
+        all_expansions = {}
+        for custom_id, body in responses.items():
+            plot_id, _, team_name = custom_id.split("|", 2)
+            try:
+                content = body["choices"][0]["message"]["content"]
+                expansion = ExpandedPlotProposal(**json.loads(content))
+            except Exception as e:
+                print(f"  ⚠ Could not parse expansion {custom_id}: {e}")
+                continue
+            team = self.team_manager.expansion_teams.get(team_name)
+            expansion.team_name = team_name
+            if team is not None:
+                expansion.model_used = team.model_name
+                try:
+                    # Some teams (Mythic Forge) post-process with the genre
+                    post_process = team._post_process_expansion
+                    if len(inspect.signature(post_process).parameters) > 1:
+                        genre = plot_ids.get(plot_id, ("", ""))[0]
+                        expansion = post_process(expansion, genre)
+                    else:
+                        expansion = post_process(expansion)
+                except Exception as e:
+                    print(f"  ⚠ Post-processing failed for {custom_id}: {e}")
+            all_expansions.setdefault(plot_id, {})[team_name] = expansion
+        return all_expansions
+
+    def _tally_votes(self, plot_id: str,
+                     expansions: Dict[str, ExpandedPlotProposal],
+                     voters: List[Any],
+                     responses: Dict[str, dict],
+                     strategy: StandardVoting) -> VotingResults:
+        """Rebuild VotingResults for one plot from the batch responses"""
+        vote_tally = {team_name: 0 for team_name in expansions.keys()}
+        votes = []
+        for voter in voters:
+            body = responses.get(f"{plot_id}|vote|{voter.name}")
+            if body is None:
+                continue
+            try:
+                content = body["choices"][0]["message"]["content"]
+                ballot = json.loads(content)
+                vote = VotingResult(
+                    agent_name=voter.name,
+                    model_used=voter.model_name,
+                    vote_for_team=ballot["vote_for_team"],
+                    reasoning=ballot.get("reasoning", ""),
+                    score_breakdown=ballot.get("scores", {})
+                )
+            except Exception as e:
+                print(f"  ⚠ Could not parse vote {plot_id}|{voter.name}: {e}")
+                continue
+            if vote.vote_for_team in vote_tally:
+                vote_tally[vote.vote_for_team] += 1
+                votes.append(vote)
+
+        winning_team = max(vote_tally, key=vote_tally.get)
+        tied_teams = [team for team, count in vote_tally.items()
+                      if count == vote_tally[winning_team]]
+        if len(tied_teams) > 1:
+            winning_team = strategy._break_tie(tied_teams, votes)
+
+        return VotingResults(
+            individual_votes=votes,
+            vote_tally=vote_tally,
+            winning_team=winning_team,
+            total_votes=len(votes),
+            voting_summary=strategy._generate_voting_summary(votes, vote_tally, expansions)
+        )
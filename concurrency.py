@@ -0,0 +1,113 @@
+"""
+Shared concurrency limits for EpicWeaver
+Plot-, team- and voter-level fan-outs draw from one request budget so
+total in-flight LLM calls respect the provider's rate limits
+"""
+
+import asyncio
+import time
+import weakref
+
+from config import config
+
+# Semaphores are bound to an event loop, so keep one per loop (weakly,
+# so finished loops don't pin their semaphores)
+_loop_semaphores = weakref.WeakKeyDictionary()
+
+# model_name -> AsyncRateLimiter, also per loop
+_loop_limiters = weakref.WeakKeyDictionary()
+
+# cache_key -> Future for calls currently on the wire, also per loop
+_loop_inflight = weakref.WeakKeyDictionary()
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """Return the shared request semaphore for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _loop_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(
+            config.get_system_config("max_concurrent_requests", 8)
+        )
+        _loop_semaphores[loop] = semaphore
+    return semaphore
+
+
+class AsyncRateLimiter:
+    """Minimal token-bucket limiter - calls proceed at full rate and
+    only wait when actually nearing the configured RPM cap"""
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, sleeping just long enough for a refill if empty"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.rate),
+                    self._tokens + (now - self._updated) * (self.rate / self.period)
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) * (self.period / self.rate))
+
+
+async def single_flight(key: str, thunk):
+    """Merge concurrent LLM calls that share a cache key (stampede guard)
+
+    The first caller runs thunk() and publishes the result; callers that
+    arrive while it is in flight await the same future instead of
+    issuing a duplicate request. Complements the disk cache, which only
+    dedups calls that have already completed.
+    """
+    loop = asyncio.get_running_loop()
+    inflight = _loop_inflight.get(loop)
+    if inflight is None:
+        inflight = {}
+        _loop_inflight[loop] = inflight
+
+    existing = inflight.get(key)
+    if existing is not None:
+        return await asyncio.shield(existing)
+
+    future = loop.create_future()
+    inflight[key] = future
+    try:
+        result = await thunk()
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved in case nobody else awaits it
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del inflight[key]
+
+
+def get_model_limiter(model_name: str) -> AsyncRateLimiter:
+    """Return the shared per-model rate limiter for the running event loop
+
+    Each model gets its own bucket since provider RPM limits are per
+    model, not per account-wide connection.
+    """
+    loop = asyncio.get_running_loop()
+    limiters = _loop_limiters.get(loop)
+    if limiters is None:
+        limiters = {}
+        _loop_limiters[loop] = limiters
+    limiter = limiters.get(model_name)
+    if limiter is None:
+        limiter = AsyncRateLimiter(
+            config.get_system_config("requests_per_minute", 500)
+        )
+        limiters[model_name] = limiter
+    return limiter
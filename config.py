@@ -5,7 +5,15 @@ Centralized configuration for file naming and system settings
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to stdlib json
+    orjson = None
+
 from pathlib import Path
 
 
@@ -13,11 +21,24 @@ from pathlib import Path
 FILE_NAME_CONFIG = {
     "template": "plot_{genre}_{hash}_{timestamp}.json",
     "timestamp_format": "%Y-%m-%dT%H-%M-%S.%f",
-    "hash_length": 16,  # Number of digits for the hash
+    "hash_length": 16,  # Number of hex digits for the hash
     "output_directory": "forge"
 }
 
 
+@lru_cache(maxsize=1024)
+def _plot_hash(plot: str) -> str:
+    """Stable hash for a plot string
+
+    Python's built-in hash() is salted per process (PYTHONHASHSEED), so
+    filenames generated from it can't be used as cache keys across runs.
+    blake2b is deterministic, and the lru_cache avoids re-hashing the
+    same plot on repeated saves.
+    """
+    digest_size = FILE_NAME_CONFIG['hash_length'] // 2  # 2 hex chars per byte
+    return hashlib.blake2b(plot.encode('utf-8'), digest_size=digest_size).hexdigest()
+
+
 # System configuration
 SYSTEM_CONFIG = {
     "max_retries": 3,
@@ -25,7 +46,13 @@ SYSTEM_CONFIG = {
     "default_temperature": 0.7,
     "voting_temperature": 0.3,
     "cache_models": True,
-    "verbose_logging": True
+    "verbose_logging": True,
+    "max_concurrent_requests": 8,  # Cap on simultaneous LLM calls (provider RPM limits)
+    "requests_per_minute": 500,  # Per-model token-bucket rate (provider RPM tier)
+    "compact_voting_prompts": True,  # Voters see trimmed expansion blocks (~4x fewer tokens)
+    "deterministic_voting": False,  # Replay mode: temperature 0 + fixed seed for all voters
+    "llm_cache_enabled": True,  # Serve repeated expansion/vote calls from .llm_cache/
+    "semantic_cache_enabled": True  # Serve near-duplicate plots from saved outputs
 }
 
 
@@ -201,26 +228,42 @@ class Config:
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file
         self.custom_config = {}
+        # Active team/voter dicts and model-fallback resolutions are
+        # static between config changes, so they are computed once and
+        # served from these caches
+        self._active_teams_cache = {}
+        self._model_fallback_cache = {}
         if config_file and Path(config_file).exists():
             self.load_custom_config()
-    
+
     def load_custom_config(self):
         """Load custom configuration from file"""
         with open(self.config_file, 'r') as f:
             self.custom_config = json.load(f)
+        self._active_teams_cache.clear()
+        self._model_fallback_cache.clear()
     
     def get_file_name(self, genre: str, plot: str) -> str:
         """Generate filename based on configuration"""
         template = self.custom_config.get('file_name_template', FILE_NAME_CONFIG['template'])
         timestamp = datetime.now().strftime(FILE_NAME_CONFIG['timestamp_format'])
-        plot_hash = str(abs(hash(plot)))[:FILE_NAME_CONFIG['hash_length']]
-        
+        plot_hash = _plot_hash(plot)
+
         return template.format(
             genre=genre.lower().replace(' ', '_'),
             hash=plot_hash,
             timestamp=timestamp
         )
     
+    def get_file_glob(self, genre: str, plot: str) -> str:
+        """Glob pattern matching every saved output for this (genre, plot)"""
+        template = self.custom_config.get('file_name_template', FILE_NAME_CONFIG['template'])
+        return template.format(
+            genre=genre.lower().replace(' ', '_'),
+            hash=_plot_hash(plot),
+            timestamp='*'
+        )
+
     def get_output_directory(self) -> Path:
         """Get output directory path"""
         dir_name = self.custom_config.get('output_directory', FILE_NAME_CONFIG['output_directory'])
@@ -231,21 +274,34 @@ class Config:
         return self.custom_config.get(key, SYSTEM_CONFIG.get(key, default))
     
     def get_model_fallback(self, model_name: str) -> Optional[str]:
-        """Get fallback model for a given model name"""
-        return self.custom_config.get('model_fallbacks', {}).get(
-            model_name, 
+        """Get fallback model for a given model name (cached until the config changes)"""
+        if model_name in self._model_fallback_cache:
+            return self._model_fallback_cache[model_name]
+
+        fallback = self.custom_config.get('model_fallbacks', {}).get(
+            model_name,
             MODEL_FALLBACKS.get(model_name)
         )
+        self._model_fallback_cache[model_name] = fallback
+        return fallback
     
     def get_active_teams(self, team_type: str) -> Dict[str, Dict[str, Any]]:
-        """Get active teams by type"""
+        """Get active teams by type (cached until the config changes)"""
+        cached = self._active_teams_cache.get(team_type)
+        if cached is not None:
+            return cached
+
         if team_type == "expansion":
             teams = self.custom_config.get('expansion_teams', TEAM_CONFIG['expansion_teams'])
-            return {k: v for k, v in teams.items() if v.get('active', True)}
+            active = {k: v for k, v in teams.items() if v.get('active', True)}
         elif team_type == "voting":
             council = self.custom_config.get('voting_council', TEAM_CONFIG['voting_council'])
-            return {k: v for k, v in council.items() if v.get('active', True)}
-        return {}
+            active = {k: v for k, v in council.items() if v.get('active', True)}
+        else:
+            active = {}
+
+        self._active_teams_cache[team_type] = active
+        return active
     
     def get_team_count_limits(self) -> Dict[str, int]:
         """Get team count configuration"""
@@ -269,9 +325,15 @@ class Config:
     def save_custom_config(self, config_dict: Dict[str, Any]):
         """Save custom configuration to file"""
         if self.config_file:
-            with open(self.config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            if orjson is not None:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w') as f:
+                    json.dump(config_dict, f, indent=2)
             self.custom_config = config_dict
+            self._active_teams_cache.clear()
+            self._model_fallback_cache.clear()
 
 
 # Global config instance
@@ -3,21 +3,34 @@ EpicWeaver League System - Competitive rankings with anti-bias mechanisms
 """
 
 import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to stdlib json
+    orjson = None
+
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
-from collections import defaultdict, deque
-import statistics
+from collections import defaultdict, deque, Counter
+from operator import itemgetter
+import heapq
+
+import numpy as np
 
 
 class LeagueSystem:
     """Manages competitive league tables for teams and voters"""
     
-    def __init__(self, league_file: str = "league_tables.json"):
+    def __init__(self, league_file: str = "league_tables.json",
+                 load_profile: str = "full"):
         self.league_file = Path(league_file)
-        self.league_data = self._load_league_data()
-        
-        # Configuration
+        # "table_only" skips the bulky audit arrays (vote_sources,
+        # history) during parse - for read-only table/stat consumers;
+        # do not save_league_data from such an instance
+        self.load_profile = load_profile
+
+        # Configuration (needed before load so form deques get their maxlen)
         self.config = {
             "active_team_slots": 5,
             "active_voter_slots": 11,
@@ -28,12 +41,59 @@ class LeagueSystem:
             "bias_threshold": 0.6,
             "consensus_bonus": 1
         }
+
+        # Plain attributes for hot-path access: an attribute load is
+        # cheaper than a dict __getitem__ chain, and loops shadow these
+        # into locals
+        self.active_team_slots = self.config["active_team_slots"]
+        self.active_voter_slots = self.config["active_voter_slots"]
+        self.points_for_win = self.config["points_for_win"]
+        self.points_for_second = self.config["points_for_second"]
+        self.min_participations = self.config["min_participations"]
+        self.form_window = self.config["form_window"]
+        self.bias_threshold = self.config["bias_threshold"]
+        self.consensus_bonus = self.config["consensus_bonus"]
+
+        self.league_data = self._load_league_data()
+
+        # Bias scores are read by every table/report build but only
+        # change when results come in, so cache between updates
+        self._bias_cache = None
+        self._bias_dirty = True
+
+        # Saves rewrite the whole document; skip them entirely when no
+        # results have been recorded since the last write
+        self._data_dirty = False
     
     def _load_league_data(self) -> Dict[str, Any]:
         """Load existing league data or create new"""
         if self.league_file.exists():
+            if self.load_profile == "table_only":
+                # Filter unwanted keys during parse rather than
+                # building the large arrays and discarding them
+                with open(self.league_file, 'r') as f:
+                    data = json.load(f, object_pairs_hook=lambda pairs: {
+                        k: v for k, v in pairs
+                        if k not in ("vote_sources", "history")})
+                self._restore_form_deques(data)
+                return data
+
             with open(self.league_file, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
+            # Migrate entries saved before incremental frequency counters:
+            # rebuild them once from the historical vote_sources records
+            for team in data.get("teams", {}).values():
+                if "voter_frequency" not in team:
+                    frequency = {}
+                    total = 0
+                    for plot in team.get("vote_sources", []):
+                        for voter in plot["voters"]:
+                            frequency[voter] = frequency.get(voter, 0) + 1
+                            total += 1
+                    team["voter_frequency"] = frequency
+                    team["total_vote_sources"] = total
+            self._restore_form_deques(data)
+            return data
         
         return {
             "teams": {},
@@ -43,12 +103,54 @@ class LeagueSystem:
             "last_updated": datetime.now().isoformat()
         }
     
-    def save_league_data(self):
-        """Save league data to file"""
+    def _restore_form_deques(self, data: Dict[str, Any]):
+        """Convert JSON lists/dicts into runtime types after loading"""
+        form_window = self.form_window
+        for entry in list(data.get("teams", {}).values()) + list(data.get("voters", {}).values()):
+            entry["form"] = deque(entry.get("form", []), maxlen=form_window)
+        for voter in data.get("voters", {}).values():
+            voter["team_preferences"] = Counter(voter.get("team_preferences", {}))
+
+    @staticmethod
+    def _json_default(obj):
+        """Serialize runtime-only types (form deques, Counters) back to JSON"""
+        if isinstance(obj, deque):
+            return list(obj)
+        if isinstance(obj, dict):  # dict subclasses such as Counter
+            return dict(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def save_league_data(self, force: bool = False, pretty: bool = False):
+        """Save league data to file (no-op when nothing changed)
+
+        Runtime saves default to compact JSON - indentation only slows
+        the encoder and bloats the file. Use pretty=True (or
+        export_readable) when a human needs to read it.
+        """
+        if not self._data_dirty and not force and self.league_file.exists():
+            return
         self.league_data["last_updated"] = datetime.now().isoformat()
-        with open(self.league_file, 'w') as f:
-            json.dump(self.league_data, f, indent=2)
-    
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            self.league_file.write_bytes(
+                orjson.dumps(self.league_data, option=option,
+                             default=self._json_default))
+        elif pretty:
+            with open(self.league_file, 'w') as f:
+                json.dump(self.league_data, f, indent=2, default=self._json_default)
+        else:
+            with open(self.league_file, 'w') as f:
+                json.dump(self.league_data, f, separators=(',', ':'),
+                          default=self._json_default)
+        self._data_dirty = False
+
+    def export_readable(self, export_file: Optional[str] = None) -> Path:
+        """Write a pretty-printed copy of the league data for inspection"""
+        export_path = Path(export_file) if export_file else self.league_file
+        with open(export_path, 'w') as f:
+            json.dump(self.league_data, f, indent=2, default=self._json_default)
+        return export_path
+
     def update_team_result(self, plot_id: str, results: Dict[str, Any]):
         """Update team standings based on plot results"""
         vote_tally = results['vote_tally']
@@ -56,38 +158,51 @@ class LeagueSystem:
         
         # Sort teams by votes
         sorted_teams = sorted(vote_tally.items(), key=lambda x: x[1], reverse=True)
-        
+
+        # Total and voter list are the same for every team; compute
+        # them once per plot instead of once per team
+        total_votes_in_plot = sum(vote_tally.values())
+        voters_in_plot = self._extract_voter_list(results)
+
         # Award points
         for position, (team_name, votes) in enumerate(sorted_teams):
             if team_name not in self.league_data["teams"]:
                 self.league_data["teams"][team_name] = self._create_team_entry(team_name)
-            
+
             team = self.league_data["teams"][team_name]
             team["played"] += 1
             team["votes_for"] += votes
-            team["votes_against"] += sum(vote_tally.values()) - votes
+            team["votes_against"] += total_votes_in_plot - votes
             
             # Points and position tracking
             if position == 0:  # Winner
                 team["won"] += 1
-                team["points"] += self.config["points_for_win"]
+                team["points"] += self.points_for_win
                 team["form"].append("W")
             elif position == 1:  # Second place
                 team["second"] += 1
-                team["points"] += self.config["points_for_second"]
+                team["points"] += self.points_for_second
                 team["form"].append("S")
             else:
                 team["form"].append("L")
-            
-            # Keep form window size
-            if len(team["form"]) > self.config["form_window"]:
-                team["form"].pop(0)
-            
-            # Track vote sources for bias detection
-            team["vote_sources"].append({
-                "plot_id": plot_id,
-                "voters": self._extract_voter_list(results)
-            })
+
+            # Track vote sources for bias detection: maintain the
+            # frequency counters incrementally so bias reads never have
+            # to rescan history
+            voter_frequency = team["voter_frequency"]
+            for voter in voters_in_plot:
+                voter_frequency[voter] = voter_frequency.get(voter, 0) + 1
+            team["total_vote_sources"] += len(voters_in_plot)
+
+            # Raw per-plot records are only needed for debugging/audit
+            if self.config.get("track_vote_sources"):
+                team["vote_sources"].append({
+                    "plot_id": plot_id,
+                    "voters": voters_in_plot
+                })
+
+        self._bias_dirty = True
+        self._data_dirty = True
     
     def update_voter_result(self, plot_id: str, results: Dict[str, Any]):
         """Update voter standings based on voting accuracy"""
@@ -96,100 +211,230 @@ class LeagueSystem:
         sorted_teams = sorted(vote_tally.items(), key=lambda x: x[1], reverse=True)
         second_team = sorted_teams[1][0] if len(sorted_teams) > 1 else None
         
-        # Track vote distribution for consensus
-        vote_distribution = defaultdict(list)
-        for vote in results['individual_votes']:
-            vote_distribution[vote['vote_for_team']].append(vote['agent_name'])
-        
-        # Find majority vote
-        majority_team = max(vote_distribution.keys(), key=lambda k: len(vote_distribution[k]))
-        is_consensus = len(vote_distribution[majority_team]) > len(results['individual_votes']) / 2
-        
-        for vote in results['individual_votes']:
+        individual_votes = results['individual_votes']
+
+        # Find majority vote with a single Counter pass
+        tally = Counter(vote['vote_for_team'] for vote in individual_votes)
+        majority_team, majority_count = tally.most_common(1)[0]
+        is_consensus = majority_count * 2 > len(individual_votes)
+
+        # Hoist config and data lookups out of the per-vote loop
+        points_for_win = self.points_for_win
+        points_for_second = self.points_for_second
+        consensus_bonus = self.consensus_bonus
+        voters = self.league_data["voters"]
+
+        for vote in individual_votes:
             voter_name = vote['agent_name']
             voted_for = vote['vote_for_team']
-            
-            if voter_name not in self.league_data["voters"]:
-                self.league_data["voters"][voter_name] = self._create_voter_entry(voter_name)
-            
-            voter = self.league_data["voters"][voter_name]
+
+            voter = voters.get(voter_name)
+            if voter is None:
+                voter = voters[voter_name] = self._create_voter_entry(voter_name)
+
             voter["votes_cast"] += 1
-            
+
             # Award points based on accuracy
             if voted_for == winning_team:
                 voter["correct_votes"] += 1
-                voter["points"] += self.config["points_for_win"]
+                voter["points"] += points_for_win
                 voter["form"].append("C")  # Correct
-                
+
                 # Consensus bonus
                 if is_consensus and voted_for == majority_team:
-                    voter["points"] += self.config["consensus_bonus"]
+                    voter["points"] += consensus_bonus
                     voter["consensus_votes"] += 1
             elif voted_for == second_team:
-                voter["points"] += self.config["points_for_second"]
+                voter["points"] += points_for_second
                 voter["form"].append("N")  # Near miss
             else:
                 voter["form"].append("W")  # Wrong
             
-            # Keep form window size
-            if len(voter["form"]) > self.config["form_window"]:
-                voter["form"].pop(0)
-            
             # Track voting patterns for bias detection
-            voter["team_preferences"][voted_for] = voter["team_preferences"].get(voted_for, 0) + 1
-            
-            # Update accuracy rate
-            if voter["votes_cast"] > 0:
-                voter["accuracy_rate"] = (voter["correct_votes"] / voter["votes_cast"]) * 100
-    
+            voter["team_preferences"][voted_for] += 1  # Counter: missing keys default to 0
+
+        self._bias_dirty = True
+        self._data_dirty = True
+
+    def update_batch(self, plot_results: List[Tuple[str, Dict[str, Any]]]):
+        """Fold a batch of plot results into the league in one pass
+
+        Equivalent to calling update_team_result and update_voter_result
+        per plot, but accumulates deltas in local counters and flushes
+        each team/voter entry once, amortizing entry-existence checks
+        and dict lookups across the batch. Useful when replaying history
+        or scoring a whole season in bulk.
+        """
+        team_acc = defaultdict(Counter)
+        team_forms = defaultdict(list)
+        team_freq = defaultdict(Counter)
+        team_sources = defaultdict(list)
+        voter_acc = defaultdict(Counter)
+        voter_forms = defaultdict(list)
+        voter_prefs = defaultdict(Counter)
+
+        points_for_win = self.points_for_win
+        points_for_second = self.points_for_second
+        consensus_bonus = self.consensus_bonus
+        track_sources = self.config.get("track_vote_sources")
+
+        for plot_id, results in plot_results:
+            vote_tally = results['vote_tally']
+            winning_team = results['winning_team']
+            individual_votes = results['individual_votes']
+
+            sorted_teams = sorted(vote_tally.items(), key=itemgetter(1), reverse=True)
+            second_team = sorted_teams[1][0] if len(sorted_teams) > 1 else None
+            total_votes_in_plot = sum(vote_tally.values())
+            voters_in_plot = [vote['agent_name'] for vote in individual_votes]
+
+            for position, (team_name, votes) in enumerate(sorted_teams):
+                acc = team_acc[team_name]
+                acc["played"] += 1
+                acc["votes_for"] += votes
+                acc["votes_against"] += total_votes_in_plot - votes
+
+                if position == 0:  # Winner
+                    acc["won"] += 1
+                    acc["points"] += points_for_win
+                    team_forms[team_name].append("W")
+                elif position == 1:  # Second place
+                    acc["second"] += 1
+                    acc["points"] += points_for_second
+                    team_forms[team_name].append("S")
+                else:
+                    team_forms[team_name].append("L")
+
+                team_freq[team_name].update(voters_in_plot)
+                acc["total_vote_sources"] += len(voters_in_plot)
+                if track_sources:
+                    team_sources[team_name].append({
+                        "plot_id": plot_id,
+                        "voters": voters_in_plot
+                    })
+
+            tally = Counter(vote['vote_for_team'] for vote in individual_votes)
+            majority_team, majority_count = tally.most_common(1)[0]
+            is_consensus = majority_count * 2 > len(individual_votes)
+
+            for vote in individual_votes:
+                voter_name = vote['agent_name']
+                voted_for = vote['vote_for_team']
+
+                acc = voter_acc[voter_name]
+                acc["votes_cast"] += 1
+
+                if voted_for == winning_team:
+                    acc["correct_votes"] += 1
+                    acc["points"] += points_for_win
+                    voter_forms[voter_name].append("C")
+                    if is_consensus and voted_for == majority_team:
+                        acc["points"] += consensus_bonus
+                        acc["consensus_votes"] += 1
+                elif voted_for == second_team:
+                    acc["points"] += points_for_second
+                    voter_forms[voter_name].append("N")
+                else:
+                    voter_forms[voter_name].append("W")
+
+                voter_prefs[voter_name][voted_for] += 1
+
+        # Flush accumulators into the league entries, once per participant
+        teams = self.league_data["teams"]
+        for team_name, acc in team_acc.items():
+            team = teams.get(team_name)
+            if team is None:
+                team = teams[team_name] = self._create_team_entry(team_name)
+            for field, delta in acc.items():
+                team[field] += delta
+            team["form"].extend(team_forms[team_name])
+            frequency = team["voter_frequency"]
+            for voter_name, count in team_freq[team_name].items():
+                frequency[voter_name] = frequency.get(voter_name, 0) + count
+            if track_sources:
+                team["vote_sources"].extend(team_sources[team_name])
+
+        voters = self.league_data["voters"]
+        for voter_name, acc in voter_acc.items():
+            voter = voters.get(voter_name)
+            if voter is None:
+                voter = voters[voter_name] = self._create_voter_entry(voter_name)
+            for field, delta in acc.items():
+                voter[field] += delta
+            voter["form"].extend(voter_forms[voter_name])
+            voter["team_preferences"].update(voter_prefs[voter_name])
+
+        self._bias_dirty = True
+        self._data_dirty = True
+
+    @staticmethod
+    def _concentration(counts: Dict[str, int], total: int) -> float:
+        """Herfindahl index of a frequency mapping: sum of squared shares
+
+        Large leagues get the NumPy reduction; for small dicts the
+        array setup cost outweighs the C loop, so keep the generator.
+        """
+        if len(counts) >= 32:
+            arr = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+            return float(((arr / total) ** 2).sum())
+        return sum((count / total) ** 2 for count in counts.values())
+
     def calculate_bias_scores(self) -> Dict[str, Dict[str, float]]:
-        """Calculate bias scores for teams and voters"""
+        """Calculate bias scores for teams and voters (cached between updates)"""
+        if not self._bias_dirty:
+            return self._bias_cache
+
         bias_scores = {"teams": {}, "voters": {}}
         
         # Team bias: How concentrated are their vote sources?
         for team_name, team_data in self.league_data["teams"].items():
-            if team_data["played"] >= self.config["min_participations"]:
-                voter_frequency = defaultdict(int)
-                total_votes = 0
-                
-                for plot in team_data["vote_sources"]:
-                    for voter in plot["voters"]:
-                        voter_frequency[voter] += 1
-                        total_votes += 1
-                
+            if team_data["played"] >= self.min_participations:
+                total_votes = team_data["total_vote_sources"]
+
                 # Calculate concentration (Herfindahl index)
                 if total_votes > 0:
-                    concentration = sum((count/total_votes)**2 for count in voter_frequency.values())
+                    concentration = self._concentration(team_data["voter_frequency"], total_votes)
                     bias_scores["teams"][team_name] = round(concentration, 3)
                 else:
                     bias_scores["teams"][team_name] = 0.0
-        
+
         # Voter bias: How concentrated are their team preferences?
         for voter_name, voter_data in self.league_data["voters"].items():
-            if voter_data["votes_cast"] >= self.config["min_participations"]:
+            if voter_data["votes_cast"] >= self.min_participations:
                 total_votes = voter_data["votes_cast"]
                 preferences = voter_data["team_preferences"]
-                
+
                 # Calculate preference concentration
                 if total_votes > 0:
-                    concentration = sum((count/total_votes)**2 for count in preferences.values())
+                    concentration = self._concentration(preferences, total_votes)
                     bias_scores["voters"][voter_name] = round(concentration, 3)
                 else:
                     bias_scores["voters"][voter_name] = 0.0
-        
+
+        self._bias_cache = bias_scores
+        self._bias_dirty = False
         return bias_scores
     
-    def get_team_league_table(self) -> List[Dict[str, Any]]:
-        """Generate sorted team league table"""
+    def get_team_league_table(self, top_only: bool = False) -> List[Dict[str, Any]]:
+        """Generate sorted team league table
+
+        With top_only, return just the active slots via a heap
+        selection (O(M log N)) and skip the bench rows entirely.
+        """
         bias_scores = self.calculate_bias_scores()
-        
+
+        # Hoist config lookups out of the per-team loop
+        min_participations = self.min_participations
+        active_team_slots = self.active_team_slots
+        team_bias = bias_scores["teams"]
+
         table = []
         for team_name, team_data in self.league_data["teams"].items():
-            if team_data["played"] >= self.config["min_participations"]:
+            if team_data["played"] >= min_participations:
                 # Calculate additional metrics
                 vote_difference = team_data["votes_for"] - team_data["votes_against"]
                 win_rate = (team_data["won"] / team_data["played"] * 100) if team_data["played"] > 0 else 0
-                
+
                 table.append({
                     "name": team_name,
                     "played": team_data["played"],
@@ -200,18 +445,31 @@ class LeagueSystem:
                     "votes_against": team_data["votes_against"],
                     "vote_difference": vote_difference,
                     "win_rate": round(win_rate, 1),
-                    "form": "".join(team_data["form"][-self.config["form_window"]:]),
-                    "bias_score": bias_scores["teams"].get(team_name, 0.0),
+                    "form": "".join(team_data["form"]),  # deque maxlen == form_window
+                    "bias_score": team_bias.get(team_name, 0.0),
                     "last_position": team_data.get("last_position", 0)
                 })
-        
-        # Sort by points, then vote difference
-        table.sort(key=lambda x: (x["points"], x["vote_difference"]), reverse=True)
-        
+
+        # Sort by points, then vote difference (itemgetter runs in C)
+        if top_only:
+            table = heapq.nlargest(active_team_slots, table,
+                                   key=itemgetter("points", "vote_difference"))
+        elif len(table) > 200:
+            # Big leagues: np.lexsort on two contiguous int arrays
+            # avoids a per-row key tuple and Python-level comparisons
+            points = np.fromiter((row["points"] for row in table),
+                                 dtype=np.int64, count=len(table))
+            vote_diff = np.fromiter((row["vote_difference"] for row in table),
+                                    dtype=np.int64, count=len(table))
+            order = np.lexsort((-vote_diff, -points))
+            table = [table[i] for i in order]
+        else:
+            table.sort(key=itemgetter("points", "vote_difference"), reverse=True)
+
         # Update positions and status
         for position, team in enumerate(table, 1):
             team["position"] = position
-            team["status"] = "active" if position <= self.config["active_team_slots"] else "bench"
+            team["status"] = "active" if position <= active_team_slots else "bench"
             
             # Position change indicator
             if team["last_position"] == 0:
@@ -228,36 +486,54 @@ class LeagueSystem:
         
         return table
     
-    def get_voter_league_table(self) -> List[Dict[str, Any]]:
-        """Generate sorted voter league table"""
+    def get_voter_league_table(self, top_only: bool = False) -> List[Dict[str, Any]]:
+        """Generate sorted voter league table
+
+        With top_only, return just the active slots via a heap
+        selection (O(M log N)) and skip the bench rows entirely.
+        """
         bias_scores = self.calculate_bias_scores()
         
         table = []
         for voter_name, voter_data in self.league_data["voters"].items():
-            if voter_data["votes_cast"] >= self.config["min_participations"]:
-                # Calculate influence score (how often in winning coalition)
-                influence = (voter_data["consensus_votes"] / voter_data["votes_cast"] * 100) if voter_data["votes_cast"] > 0 else 0
-                
+            if voter_data["votes_cast"] >= self.min_participations:
+                # Accuracy and influence are derived here rather than
+                # maintained per vote on the update path
+                votes_cast = voter_data["votes_cast"]
+                accuracy = (voter_data["correct_votes"] / votes_cast * 100) if votes_cast > 0 else 0
+                influence = (voter_data["consensus_votes"] / votes_cast * 100) if votes_cast > 0 else 0
+
                 table.append({
                     "name": voter_name,
                     "votes_cast": voter_data["votes_cast"],
                     "correct_votes": voter_data["correct_votes"],
                     "points": voter_data["points"],
-                    "accuracy_rate": round(voter_data["accuracy_rate"], 1),
+                    "accuracy_rate": round(accuracy, 1),
                     "influence_score": round(influence, 1),
                     "consensus_votes": voter_data["consensus_votes"],
-                    "form": "".join(voter_data["form"][-self.config["form_window"]:]),
+                    "form": "".join(voter_data["form"]),  # deque maxlen == form_window
                     "bias_score": bias_scores["voters"].get(voter_name, 0.0),
                     "last_position": voter_data.get("last_position", 0)
                 })
         
         # Sort by points, then accuracy
-        table.sort(key=lambda x: (x["points"], x["accuracy_rate"]), reverse=True)
+        if top_only:
+            table = heapq.nlargest(self.active_voter_slots, table,
+                                   key=itemgetter("points", "accuracy_rate"))
+        elif len(table) > 200:
+            points = np.fromiter((row["points"] for row in table),
+                                 dtype=np.int64, count=len(table))
+            accuracy = np.fromiter((row["accuracy_rate"] for row in table),
+                                   dtype=np.float64, count=len(table))
+            order = np.lexsort((-accuracy, -points))
+            table = [table[i] for i in order]
+        else:
+            table.sort(key=itemgetter("points", "accuracy_rate"), reverse=True)
         
         # Update positions and status
         for position, voter in enumerate(table, 1):
             voter["position"] = position
-            voter["status"] = "active" if position <= self.config["active_voter_slots"] else "bench"
+            voter["status"] = "active" if position <= self.active_voter_slots else "bench"
             
             # Position change indicator
             if voter["last_position"] == 0:
@@ -280,9 +556,9 @@ class LeagueSystem:
         
         # Find potential bias issues
         biased_teams = {k: v for k, v in bias_scores["teams"].items() 
-                       if v > self.config["bias_threshold"]}
+                       if v > self.bias_threshold}
         biased_voters = {k: v for k, v in bias_scores["voters"].items() 
-                        if v > self.config["bias_threshold"]}
+                        if v > self.bias_threshold}
         
         # Analyze voting coalitions
         coalitions = self._detect_voting_coalitions()
@@ -305,8 +581,10 @@ class LeagueSystem:
             "points": 0,
             "votes_for": 0,
             "votes_against": 0,
-            "form": [],
+            "form": deque(maxlen=self.form_window),
             "vote_sources": [],
+            "voter_frequency": {},
+            "total_vote_sources": 0,
             "last_position": 0,
             "joined_date": datetime.now().isoformat()
         }
@@ -318,20 +596,16 @@ class LeagueSystem:
             "votes_cast": 0,
             "correct_votes": 0,
             "points": 0,
-            "accuracy_rate": 0.0,
             "consensus_votes": 0,
-            "form": [],
-            "team_preferences": {},
+            "form": deque(maxlen=self.form_window),
+            "team_preferences": Counter(),
             "last_position": 0,
             "joined_date": datetime.now().isoformat()
         }
     
     def _extract_voter_list(self, results: Dict[str, Any]) -> List[str]:
         """Extract list of voters who voted for each team"""
-        voter_list = []
-        for vote in results['individual_votes']:
-            voter_list.append(vote['agent_name'])
-        return voter_list
+        return [vote['agent_name'] for vote in results['individual_votes']]
     
     def _detect_voting_coalitions(self) -> List[Dict[str, Any]]:
         """Detect potential voting coalitions or patterns"""
@@ -356,7 +630,10 @@ class LeagueSystem:
         all_biases = list(bias_scores["teams"].values()) + list(bias_scores["voters"].values())
         
         if all_biases:
-            avg_bias = statistics.mean(all_biases)
+            # sum()/len() rather than statistics.mean: the scores are
+            # already rounded floats, so exact-fraction averaging is
+            # pure overhead
+            avg_bias = sum(all_biases) / len(all_biases)
             # Convert to fairness score (inverse of bias)
             fairness = (1 - avg_bias) * 100
             return round(fairness, 1)
@@ -391,6 +668,9 @@ class LeagueSystem:
         if starter_file.exists():
             with open(starter_file, 'r') as f:
                 self.league_data = json.load(f)
+                self._restore_form_deques(self.league_data)
+                self._bias_dirty = True
+                self._data_dirty = True
                 self.league_data["last_updated"] = datetime.now().isoformat()
                 self.save_league_data()
                 print("✓ League reset to fresh state")
@@ -411,7 +691,7 @@ class LeagueSystem:
         
         # Save current data to archive
         with open(archive_path, 'w') as f:
-            json.dump(self.league_data, f, indent=2)
+            json.dump(self.league_data, f, indent=2, default=self._json_default)
         
         return archive_path
     
@@ -439,6 +719,7 @@ class LeagueSystem:
             self.league_data["voters"][voter_name] = self._create_voter_entry(voter_name)
         
         self.league_data["season"] = new_season
+        self._data_dirty = True
         self.save_league_data()
         
         print(f"✓ Started season {new_season} with {len(team_names)} teams and {len(voter_names)} voters")
@@ -469,6 +750,8 @@ class LeagueSystem:
             pruned_count += old_count - keep_last_n
         
         if pruned_count > 0:
+            self._bias_dirty = True
+            self._data_dirty = True
             self.save_league_data()
             print(f"✓ Pruned {pruned_count} old entries to reduce file size")
         
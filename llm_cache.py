@@ -0,0 +1,79 @@
+"""
+Deterministic disk cache for LLM calls in EpicWeaver
+Re-running the pipeline on a plot it has already seen should not re-pay
+the full API bill and latency
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from config import config
+
+
+class LLMCache:
+    """SHA-256-keyed persistent cache of LLM responses
+
+    Entries are stored as individual JSON files under the cache
+    directory. Keys are built from the call's deterministic inputs
+    (model name, temperature, prompt or expansion inputs, output
+    schema), so a repeated run with identical inputs is served from
+    disk instead of the API. The cache is best-effort: corrupt or
+    unwritable entries degrade to a normal API call.
+    """
+
+    def __init__(self, cache_dir: str = ".llm_cache"):
+        self.cache_dir = Path(cache_dir)
+
+    @property
+    def enabled(self) -> bool:
+        """Cache can be disabled via system config"""
+        return bool(config.get_system_config("llm_cache_enabled", True))
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a deterministic key from the call's inputs"""
+        payload = json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss"""
+        if not self.enabled:
+            return None
+        cache_file = self.cache_dir / f"{key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # Treat a corrupt entry as a miss
+            return None
+
+    def set(self, key: str, value: Any):
+        """Store a value; failures are non-fatal"""
+        if not self.enabled:
+            return
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            with open(self.cache_dir / f"{key}.json", 'w') as f:
+                json.dump(value, f)
+        except (TypeError, OSError) as e:
+            print(f"Warning: could not cache LLM response: {e}")
+
+
+# Shared cache instance
+llm_cache = LLMCache()
+
+
+def expansion_cache_key(team: Any, genre: str, plot: str) -> str:
+    """Cache key over everything that determines a team's expansion
+
+    Lives here (not on TeamManager) so teams can write entries from
+    their own success paths without importing the manager.
+    """
+    return llm_cache.make_key(
+        type(team).__name__, team.model_name, team.temperature,
+        genre, plot, "ExpandedPlotProposal"
+    )
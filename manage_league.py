@@ -31,9 +31,13 @@ def main():
     
     args = parser.parse_args()
     
-    # Initialize league system
-    league = LeagueSystem()
-    
+    # Initialize league system (stats only reads the tables, so skip
+    # parsing the bulky audit arrays)
+    if args.command == 'stats':
+        league = LeagueSystem(load_profile="table_only")
+    else:
+        league = LeagueSystem()
+
     if args.command == 'stats':
         stats = league.get_league_stats()
         print("\n📊 LEAGUE STATISTICS")
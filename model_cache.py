@@ -0,0 +1,106 @@
+"""
+Process-wide ChatOpenAI instance cache for EpicWeaver
+One instance per (model, temperature) shared by every team and voter
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from config import config
+
+
+# Constructing ChatOpenAI does no I/O, so instances are safe to build
+# lazily and share across the whole process
+_MODEL_CACHE: Dict[Tuple[str, float, Optional[int]], ChatOpenAI] = {}
+_CACHE_LOCK = threading.Lock()
+
+# One connection pool for every model instance - without this each
+# ChatOpenAI brings its own httpx client and concurrent teams/voters
+# open duplicate TCP+TLS connections to api.openai.com
+_HTTP_CLIENTS: Optional[Tuple[httpx.Client, httpx.AsyncClient]] = None
+
+
+def _shared_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """Lazily build the shared sync/async HTTP clients (callers hold the lock)"""
+    global _HTTP_CLIENTS
+    if _HTTP_CLIENTS is None:
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        # Fail fast on unreachable endpoints without capping slow completions
+        timeout = httpx.Timeout(60, connect=10)
+        try:
+            # HTTP/2 multiplexes the whole fan-out over few connections
+            _HTTP_CLIENTS = (
+                httpx.Client(http2=True, timeout=timeout, limits=limits),
+                httpx.AsyncClient(http2=True, timeout=timeout, limits=limits),
+            )
+        except ImportError:
+            # h2 extra not installed - HTTP/1.1 still shares the pool
+            _HTTP_CLIENTS = (
+                httpx.Client(timeout=timeout, limits=limits),
+                httpx.AsyncClient(timeout=timeout, limits=limits),
+            )
+    return _HTTP_CLIENTS
+
+
+async def aclose():
+    """Close the shared HTTP clients (call at process shutdown)"""
+    global _HTTP_CLIENTS
+    with _CACHE_LOCK:
+        clients, _HTTP_CLIENTS = _HTTP_CLIENTS, None
+    if clients is not None:
+        sync_client, async_client = clients
+        sync_client.close()
+        await async_client.aclose()
+
+
+def get_model(model_name: str, temperature: float,
+              seed: Optional[int] = None) -> ChatOpenAI:
+    """Return the shared ChatOpenAI instance for (model, temperature, seed)
+
+    No live probe call is made here - an unavailable model surfaces as
+    an exception on its first real invoke, at which point the caller
+    can switch to its configured fallback via activate_fallback().
+    """
+    key = (model_name, temperature, seed)
+    with _CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            http_client, http_async_client = _shared_http_clients()
+            model = ChatOpenAI(
+                model=model_name,
+                temperature=temperature,
+                seed=seed,
+                http_client=http_client,
+                http_async_client=http_async_client,
+            )
+            _MODEL_CACHE[key] = model
+        return model
+
+
+def activate_fallback(agent: Any) -> bool:
+    """Swap a failed agent onto its configured fallback model
+
+    Called from a team's or voter's error path after a real API call
+    has failed. Resolves the fallback chain for agent.model_name,
+    rebinds agent.model/model_name, and returns True exactly once so
+    the caller can retry; subsequent failures fall through to the
+    agent's own fallback output.
+    """
+    if getattr(agent, '_fallback_applied', False):
+        return False
+
+    fallback = config.get_model_fallback(agent.model_name)
+    if not fallback:
+        # Last resort, mirrors the old probe-time behavior
+        fallback = "gpt-4o-mini-2024-07-18"
+        if fallback == agent.model_name:
+            return False
+
+    print(f"Switching {agent.name} to fallback model {fallback}")
+    agent.model_name = fallback
+    agent.model = get_model(fallback, agent.temperature, getattr(agent, 'seed', None))
+    agent._fallback_applied = True
+    return True
@@ -1,14 +1,20 @@
 # Plot Expander - Multi-Agent System with Voting (Modular Version)
 
 from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+import asyncio
+import hashlib
+import io
 import json
 import os
+import sys
 from dotenv import load_dotenv
 
 from config import config
 from schemas import PlotExpanderOutput
+from semantic_cache import SemanticCache
 from team_manager import TeamManager
 from voting_strategies import VotingStrategyFactory
 
@@ -24,105 +30,193 @@ class PlotExpander:
         self.output_dir = config.get_output_directory()
         self.output_dir.mkdir(exist_ok=True)
         self.voting_strategy = "standard"  # Default voting strategy
+        self.semantic_cache = SemanticCache(self.output_dir / ".semantic_cache.json")
+        # Disk writes happen off the critical path so serialization
+        # overlaps with the next plot's LLM wait
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_saves = []
+        self._loop = None  # persistent event loop, created on first use
     
+    def _run(self, coro):
+        """Drive a coroutine on the expander's persistent event loop
+
+        One loop for the expander's lifetime keeps the per-loop
+        semaphores, rate limiters and warmed HTTP connections alive
+        across plots instead of rebuilding them on every asyncio.run.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """Release the persistent loop, shared HTTP clients and I/O pool"""
+        if self._loop is not None and not self._loop.is_closed():
+            import model_cache
+            self._loop.run_until_complete(model_cache.aclose())
+            self._loop.close()
+        self.flush_saves()
+        self._io_pool.shutdown(wait=True)
+
+    def _save_in_background(self, plot_id: str, output: PlotExpanderOutput):
+        """Queue the disk write; flush_saves() joins them later"""
+        self._pending_saves.append(
+            self._io_pool.submit(self.save_plot_output, plot_id, output)
+        )
+
+    def flush_saves(self):
+        """Block until all queued saves hit disk, surfacing any failures"""
+        for future in self._pending_saves:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Warning: background save failed: {e}")
+        self._pending_saves.clear()
+
+    @staticmethod
+    def _plot_id(genre: str, plot: str) -> str:
+        """Deterministic plot ID (built-in hash() is salted per process)"""
+        digest = hashlib.blake2b(f"{genre}|{plot}".encode('utf-8'), digest_size=8).hexdigest()
+        return f"{genre.lower()}_{digest}"
+
     def save_plot_output(self, plot_id: str, output: PlotExpanderOutput):
         """Save plot expansion output to forge folder"""
         filename = config.get_file_name(output.genre, output.original_plot)
         filepath = self.output_dir / filename
         
-        # Convert Pydantic model to dict and save as JSON
-        output_dict = output.model_dump()
-        with open(filepath, 'w') as f:
-            json.dump(output_dict, f, indent=2)
-        
+        # Serialize straight from the model with pydantic-core's C
+        # serializer - skips the model_dump() dict intermediate entirely
+        filepath.write_text(output.model_dump_json(indent=2))
+
         print(f"Saved plot expansion to: {filepath}")
+
+        # Index the saved file so reworded versions of this plot hit the cache
+        self.semantic_cache.store(output.genre, output.original_plot, filepath)
         return filepath
     
     def print_voting_summary(self, output: PlotExpanderOutput):
-        """Print voting summary in a clear, readable format"""
+        """Print voting summary in a clear, readable format
+
+        The whole multi-section report is rendered into one buffer and
+        written with a single stdout call - under concurrent plot runs
+        this keeps reports intact and avoids hundreds of tiny writes.
+        """
         summary = output.voting_results.voting_summary
-        
-        print("\n" + "="*80)
-        print("COMPREHENSIVE VOTING SUMMARY")
-        print("="*80)
-        
+        buf = io.StringIO()
+        w = buf.write
+
+        w("\n" + "="*80 + "\n")
+        w("COMPREHENSIVE VOTING SUMMARY\n")
+        w("="*80 + "\n")
+
         # 1. Vote Distribution
-        print("\n📊 VOTE DISTRIBUTION:")
-        print("-" * 40)
+        w("\n📊 VOTE DISTRIBUTION:\n")
+        w("-" * 40 + "\n")
         for team, count in summary["vote_distribution"].items():
             winner_mark = " 🏆" if team == output.voting_results.winning_team else ""
-            print(f"  {team}: {count} votes{winner_mark}")
-        
+            w(f"  {team}: {count} votes{winner_mark}\n")
+
         # 2. Agent Votes
-        print("\n🗳️ AGENT VOTING DETAILS:")
-        print("-" * 40)
+        w("\n🗳️ AGENT VOTING DETAILS:\n")
+        w("-" * 40 + "\n")
         for agent, details in summary["agent_votes"].items():
-            print(f"  {agent}:")
-            print(f"    → Voted for: {details['voted_for']}")
-            print(f"    → Model: {details['model_used']}")
-            print(f"    → Total score given: {details['total_score']}")
-        
+            w(f"  {agent}:\n")
+            w(f"    → Voted for: {details['voted_for']}\n")
+            w(f"    → Model: {details['model_used']}\n")
+            w(f"    → Total score given: {details['total_score']}\n")
+
         # 3. Team Average Scores
-        print("\n📈 TEAM AVERAGE SCORES:")
-        print("-" * 40)
+        w("\n📈 TEAM AVERAGE SCORES:\n")
+        w("-" * 40 + "\n")
         for team, scores in summary["team_avg_scores"].items():
-            print(f"  {team}:")
+            w(f"  {team}:\n")
             for criterion, avg_score in scores.items():
                 if criterion != "total_avg":
-                    print(f"    - {criterion}: {avg_score}")
-            print(f"    📊 Overall Average: {scores.get('total_avg', 0)}")
-        
+                    w(f"    - {criterion}: {avg_score}\n")
+            w(f"    📊 Overall Average: {scores.get('total_avg', 0)}\n")
+
         # 4. Voting Patterns
-        print("\n🔍 VOTING PATTERNS:")
-        print("-" * 40)
+        w("\n🔍 VOTING PATTERNS:\n")
+        w("-" * 40 + "\n")
         patterns = summary["voting_patterns"]
-        print(f"  Most unanimous criteria: {', '.join(patterns['unanimous_criteria'])}")
-        print(f"  Most divisive criteria: {', '.join(patterns['most_divisive_criteria'])}")
-        
-        print("\n  Model voting preferences:")
+        w(f"  Most unanimous criteria: {', '.join(patterns['unanimous_criteria'])}\n")
+        w(f"  Most divisive criteria: {', '.join(patterns['most_divisive_criteria'])}\n")
+
+        w("\n  Model voting preferences:\n")
         for model, prefs in patterns["model_preferences"].items():
-            print(f"    {model}:")
+            w(f"    {model}:\n")
             for team, count in prefs.items():
-                print(f"      - {team}: {count} vote(s)")
-        
+                w(f"      - {team}: {count} vote(s)\n")
+
         # 5. Quick summary dict
-        print("\n📋 QUICK SUMMARY DICT:")
-        print("-" * 40)
+        w("\n📋 QUICK SUMMARY DICT:\n")
+        w("-" * 40 + "\n")
         quick_summary = {
             "winner": output.voting_results.winning_team,
             "vote_count": summary["vote_distribution"],
             "agent_votes": {
-                agent: details["voted_for"] 
+                agent: details["voted_for"]
                 for agent, details in summary["agent_votes"].items()
             }
         }
-        print(json.dumps(quick_summary, indent=2))
-        
+        w(json.dumps(quick_summary, indent=2) + "\n")
+
         # 6. Winning expansion details
-        print("\n🏆 WINNING EXPANSION DETAILS:")
-        print("-" * 40)
+        w("\n🏆 WINNING EXPANSION DETAILS:\n")
+        w("-" * 40 + "\n")
         selected = output.selected_expansion
-        print(f"Team: {selected['team_name']}")
-        print(f"Model: {selected['model_used']}")
-        print(f"Title: {selected['title']}")
-        print(f"Logline: {selected['logline']}")
-        print(f"Main Characters: {len(selected['main_characters'])}")
+        w(f"Team: {selected['team_name']}\n")
+        w(f"Model: {selected['model_used']}\n")
+        w(f"Title: {selected['title']}\n")
+        w(f"Logline: {selected['logline']}\n")
+        w(f"Main Characters: {len(selected['main_characters'])}\n")
         for char in selected['main_characters'][:2]:  # Show first 2 characters
-            print(f"  - {char['name']} ({char['role']})")
-        print(f"Themes: {', '.join(selected['themes'])}")
-        print(f"Unique Hooks: {', '.join(selected['unique_hooks'][:2])}")  # Show first 2 hooks
-        print(f"Complexity: {selected['estimated_complexity']}/10")
+            w(f"  - {char['name']} ({char['role']})\n")
+        w(f"Themes: {', '.join(selected['themes'])}\n")
+        w(f"Unique Hooks: {', '.join(selected['unique_hooks'][:2])}\n")  # Show first 2 hooks
+        w(f"Complexity: {selected['estimated_complexity']}/10\n")
+
+        sys.stdout.write(buf.getvalue())
     
-    def expand_single_plot(self, genre: str, plot: str) -> PlotExpanderOutput:
+    def _check_caches(self, genre: str, plot: str, reuse: bool) -> PlotExpanderOutput:
+        """Return a cached output for this plot, or None to run the pipeline"""
+        # With reuse=True an identical (genre, plot) rerun short-circuits to
+        # the most recent saved output (filenames hash deterministically)
+        if reuse:
+            existing = sorted(self.output_dir.glob(config.get_file_glob(genre, plot)))
+            if existing:
+                try:
+                    with open(existing[-1], 'r') as f:
+                        saved = json.load(f)
+                    print(f"✓ Reusing saved expansion: {existing[-1]}")
+                    return PlotExpanderOutput(**saved)
+                except (json.JSONDecodeError, OSError) as e:
+                    print(f"Warning: could not reuse {existing[-1]}: {e}")
+
+        # Semantic cache: a plot that embeds close enough to one we already
+        # processed returns the stored output instead of a full re-run
+        cached = self.semantic_cache.lookup(genre, plot)
+        if cached is not None:
+            return PlotExpanderOutput(**cached)
+
+        return None
+
+    def expand_single_plot(self, genre: str, plot: str, reuse: bool = False) -> PlotExpanderOutput:
         """Main function: Expand one plot through full process - auto-uses async for speed"""
+        cached = self._check_caches(genre, plot, reuse)
+        if cached is not None:
+            return cached
+
         try:
             # Try async version first (80% faster)
             import asyncio
-            return asyncio.run(self._expand_single_plot_async(genre, plot))
+            result = self._run(self._expand_single_plot_async(genre, plot))
         except Exception as e:
             print(f"Async not available ({e}), using standard processing...")
             # Fallback to sync version
-            return self._expand_single_plot_sync(genre, plot)
+            result = self._expand_single_plot_sync(genre, plot)
+        # Single-plot callers expect the file on disk when we return
+        self.flush_saves()
+        return result
     
     async def _expand_single_plot_async(self, genre: str, plot: str) -> PlotExpanderOutput:
         """Async version - runs teams and voters in parallel"""
@@ -138,7 +232,7 @@ class PlotExpander:
         # Step 2: Voting process in parallel (NEW - FAST!)
         voting_results = await self.team_manager.conduct_voting_async(
             all_expansions,
-            voting_strategy="standard"
+            voting_strategy=self.voting_strategy
         )
         
         # Step 3: Determine winning expansion (same as before)
@@ -146,34 +240,8 @@ class PlotExpander:
         winning_expansion = all_expansions[winning_team]
         
         # Step 4: Convert to output format (same as before)
-        selected_expansion = {
-            "team_name": winning_expansion.team_name,
-            "model_used": winning_expansion.model_used,
-            "title": winning_expansion.title,
-            "logline": winning_expansion.logline,
-            "main_characters": [
-                {
-                    "name": char.name,
-                    "role": char.role,
-                    "description": char.description
-                } for char in winning_expansion.main_characters
-            ],
-            "plot_summary": winning_expansion.plot_summary,
-            "central_conflict": winning_expansion.central_conflict,
-            "story_beats": {
-                "opening": winning_expansion.story_beats.opening,
-                "catalyst": winning_expansion.story_beats.catalyst,
-                "midpoint": winning_expansion.story_beats.midpoint,
-                "crisis": winning_expansion.story_beats.crisis,
-                "resolution": winning_expansion.story_beats.resolution
-            },
-            "ending": winning_expansion.ending,
-            "key_elements": winning_expansion.key_elements,
-            "potential_arcs": winning_expansion.potential_arcs,
-            "themes": winning_expansion.themes,
-            "unique_hooks": winning_expansion.unique_hooks,
-            "estimated_complexity": winning_expansion.estimated_complexity
-        }
+        # model_dump covers every field the old hand-built dict copied
+        selected_expansion = winning_expansion.model_dump()
         
         end_time = datetime.now()
         output = PlotExpanderOutput(
@@ -186,9 +254,9 @@ class PlotExpander:
             processing_time=(end_time - start_time).total_seconds()
         )
         
-        # Step 5: Save to file
-        plot_id = f"{genre.lower()}_{abs(hash(plot))}"
-        self.save_plot_output(plot_id, output)
+        # Step 5: Save to file (in the background)
+        plot_id = self._plot_id(genre, plot)
+        self._save_in_background(plot_id, output)
         
         # Step 6: Print voting summary
         self.print_voting_summary(output)
@@ -213,34 +281,8 @@ class PlotExpander:
         winning_expansion = all_expansions[voting_results.winning_team]
         
         # Step 4: Create output with consolidated selected_expansion
-        selected_expansion = {
-            "team_name": winning_expansion.team_name,
-            "model_used": winning_expansion.model_used,
-            "title": winning_expansion.title,
-            "logline": winning_expansion.logline,
-            "main_characters": [
-                {
-                    "name": char.name,
-                    "role": char.role,
-                    "description": char.description
-                } for char in winning_expansion.main_characters
-            ],
-            "plot_summary": winning_expansion.plot_summary,
-            "central_conflict": winning_expansion.central_conflict,
-            "story_beats": {
-                "opening": winning_expansion.story_beats.opening,
-                "catalyst": winning_expansion.story_beats.catalyst,
-                "midpoint": winning_expansion.story_beats.midpoint,
-                "crisis": winning_expansion.story_beats.crisis,
-                "resolution": winning_expansion.story_beats.resolution
-            },
-            "ending": winning_expansion.ending,
-            "key_elements": winning_expansion.key_elements,
-            "potential_arcs": winning_expansion.potential_arcs,
-            "themes": winning_expansion.themes,
-            "unique_hooks": winning_expansion.unique_hooks,
-            "estimated_complexity": winning_expansion.estimated_complexity
-        }
+        # model_dump covers every field the old hand-built dict copied
+        selected_expansion = winning_expansion.model_dump()
         
         end_time = datetime.now()
         output = PlotExpanderOutput(
@@ -253,17 +295,23 @@ class PlotExpander:
             processing_time=(end_time - start_time).total_seconds()
         )
         
-        # Step 5: Save to file
-        plot_id = f"{genre.lower()}_{abs(hash(plot))}"
-        self.save_plot_output(plot_id, output)
+        # Step 5: Save to file (in the background)
+        plot_id = self._plot_id(genre, plot)
+        self._save_in_background(plot_id, output)
         
         # Step 6: Print voting summary
         self.print_voting_summary(output)
         
         return output
     
-    def expand_plot_list(self, plot_list: List[Tuple[str, str]]) -> List[PlotExpanderOutput]:
-        """Process multiple plots"""
+    def expand_plot_list(self, plot_list: List[Tuple[str, str]],
+                         mode: str = "online") -> List[PlotExpanderOutput]:
+        """Process multiple plots
+
+        mode="batch" routes the whole catalog through the OpenAI Batch
+        API (~50% cost, up to 24h per stage) - meant for overnight
+        large-scale runs, not interactive use.
+        """
         results = []
         
         # Print active teams info
@@ -281,18 +329,53 @@ class PlotExpander:
             print(f"  - {agent}")
         print("="*80)
         
+        if mode == "batch":
+            from batch_runner import BatchRunner
+            plot_ids = {self._plot_id(genre, plot): (genre, plot)
+                        for genre, plot in plot_list}
+            outputs = BatchRunner(self.team_manager).run(plot_list, plot_ids)
+            for output in outputs:
+                self.save_plot_output(self._plot_id(output.genre, output.original_plot), output)
+            return outputs
+
+        try:
+            # Plots are independent, so run their pipelines concurrently
+            import asyncio
+            results = self._run(self._expand_plot_list_async(plot_list))
+            self.flush_saves()
+            return results
+        except Exception as e:
+            print(f"Concurrent processing not available ({e}), processing sequentially...")
+
         for genre, plot in plot_list:
             print(f"\n{'='*60}")
             print(f"Processing: {genre} - {plot}")
             print(f"{'='*60}")
-            
+
             result = self.expand_single_plot(genre, plot)
             results.append(result)
-            
+
             # Voting summary is already printed in expand_single_plot
-        
+
         return results
 
+    async def _expand_plot_list_async(self, plot_list: List[Tuple[str, str]]) -> List[PlotExpanderOutput]:
+        """Fan all plots out concurrently - total in-flight LLM calls stay
+        bounded by the shared request semaphore inside each pipeline"""
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._expand_plot_task(genre, plot))
+                for genre, plot in plot_list
+            ]
+        return [task.result() for task in tasks]
+
+    async def _expand_plot_task(self, genre: str, plot: str) -> PlotExpanderOutput:
+        """One plot's pipeline with the cache short-circuit"""
+        cached = await asyncio.to_thread(self._check_caches, genre, plot, False)
+        if cached is not None:
+            return cached
+        return await self._expand_single_plot_async(genre, plot)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ from datetime import datetime
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from analytics import PlotAnalytics
+from analytics import PlotAnalytics, get_analytics
 
 # Page configuration
 st.set_page_config(
@@ -889,7 +889,7 @@ def display_league_tables(analytics: PlotAnalytics):
 def display_analytics_mode():
     """Display analytics interface"""
     # Initialize analytics
-    analytics = PlotAnalytics()
+    analytics = get_analytics()
     
     if not analytics.plots_data:
         st.error("No plot data found for analytics.")
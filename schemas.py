@@ -3,10 +3,21 @@ Input/Output schemas for EpicWeaver
 Defines the contracts between teams and the system
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator
 from typing import List, Dict, Any
 
 
+# Fixed voting criteria, in score_breakdown storage order
+CRITERIA = (
+    "originality",
+    "coherence",
+    "market_potential",
+    "character_depth",
+    "thematic_richness",
+    "expandability",
+)
+
+
 # Input schemas
 class PlotInput(BaseModel):
     """Schema for plot expansion input"""
@@ -51,12 +62,38 @@ class ExpandedPlotProposal(BaseModel):
 
 
 class VotingResult(BaseModel):
-    """Schema for individual voting result"""
+    """Schema for individual voting result
+
+    Scores are stored as a fixed-width int list in CRITERIA order (a
+    dict of boxed ints per vote is ~10x the memory and slower to stack
+    for stats); the JSON form stays the criterion -> score dict.
+    """
     agent_name: str = Field(description="Name of voting agent")
     model_used: str = Field(description="Model used by voting agent")
     vote_for_team: str = Field(description="Team name they voted for")
     reasoning: str = Field(description="Why they chose this expansion")
-    score_breakdown: Dict[str, int] = Field(default_factory=dict, description="Scores for each criteria")
+    score_breakdown: List[int] = Field(
+        default_factory=lambda: [0] * len(CRITERIA),
+        description="Scores per criterion, in CRITERIA order"
+    )
+
+    @field_validator('score_breakdown', mode='before')
+    @classmethod
+    def _coerce_scores(cls, value):
+        """Accept the legacy criterion -> score dict form"""
+        if isinstance(value, dict):
+            return [int(value.get(criterion, 0)) for criterion in CRITERIA]
+        return value
+
+    @field_serializer('score_breakdown')
+    def _serialize_scores(self, value: List[int]) -> Dict[str, int]:
+        """Keep the on-disk dict format stable for saved outputs"""
+        return dict(zip(CRITERIA, value))
+
+    @property
+    def score_dict(self) -> Dict[str, int]:
+        """Scores as a criterion -> score dict"""
+        return dict(zip(CRITERIA, self.score_breakdown))
 
 
 class VotingResults(BaseModel):
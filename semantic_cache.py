@@ -0,0 +1,125 @@
+"""
+Semantic cache for near-duplicate plots in EpicWeaver
+Two plots differing by a punctuation mark should not trigger a full
+re-expansion and vote - paraphrases of a processed plot return the
+stored output in milliseconds
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from config import config
+
+
+class SemanticCache:
+    """Embedding-based cache over (genre, plot) -> saved output file
+
+    Each processed plot is embedded with text-embedding-3-small and the
+    (embedding, filepath) pair is persisted to a JSON index next to the
+    output files. A lookup embeds the incoming plot, scans the index
+    with numpy cosine similarity and, above the threshold, loads the
+    stored PlotExpanderOutput JSON instead of re-running the pipeline.
+    Best-effort throughout: embedding failures degrade to a cache miss.
+    """
+
+    def __init__(self, index_file: str = "forge/.semantic_cache.json",
+                 similarity_threshold: float = 0.97):
+        self.index_file = Path(index_file)
+        self.similarity_threshold = similarity_threshold
+        self.entries = self._load_index()
+        self._embedder = None
+        self._embedding_cache = {}  # text -> vector, avoids double-embed on lookup+store
+        self._matrix = None  # normalized embeddings, rebuilt lazily after stores
+        self._store_lock = threading.Lock()  # stores can arrive from I/O pool threads
+
+    @property
+    def enabled(self) -> bool:
+        """Cache can be disabled via system config"""
+        return bool(config.get_system_config("semantic_cache_enabled", True))
+
+    def _load_index(self) -> list:
+        """Load the persisted (embedding, filepath) index"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+        return []
+
+    def _save_index(self):
+        """Persist the index; failures are non-fatal"""
+        try:
+            self.index_file.parent.mkdir(exist_ok=True)
+            with open(self.index_file, 'w') as f:
+                json.dump(self.entries, f)
+        except OSError as e:
+            print(f"Warning: could not persist semantic cache index: {e}")
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text, returning None if the embedding call fails"""
+        cached = self._embedding_cache.get(text)
+        if cached is not None:
+            return cached
+        try:
+            if self._embedder is None:
+                from langchain_openai import OpenAIEmbeddings
+                self._embedder = OpenAIEmbeddings(model="text-embedding-3-small")
+            vector = np.asarray(self._embedder.embed_query(text), dtype=np.float32)
+        except Exception as e:
+            print(f"Warning: semantic cache embedding failed: {e}")
+            return None
+        self._embedding_cache[text] = vector
+        return vector
+
+    def _normalized_matrix(self) -> np.ndarray:
+        """Stacked unit-norm embeddings for all index entries"""
+        if self._matrix is None:
+            matrix = np.asarray([entry["embedding"] for entry in self.entries],
+                                dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._matrix = matrix / np.maximum(norms, 1e-12)
+        return self._matrix
+
+    def lookup(self, genre: str, plot: str) -> Optional[Dict[str, Any]]:
+        """Return the stored output dict for a near-duplicate plot, or None"""
+        if not self.enabled or not self.entries:
+            return None
+        query = self._embed(f"{genre}|{plot}")
+        if query is None:
+            return None
+
+        similarities = self._normalized_matrix() @ (query / max(np.linalg.norm(query), 1e-12))
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        filepath = Path(self.entries[best]["filepath"])
+        if not filepath.exists():
+            return None
+        try:
+            with open(filepath, 'r') as f:
+                output = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+        print(f"✓ Semantic cache hit (similarity {similarities[best]:.3f}): {filepath}")
+        return output
+
+    def store(self, genre: str, plot: str, filepath: Path):
+        """Upsert the (embedding, filepath) pair for a processed plot"""
+        if not self.enabled:
+            return
+        vector = self._embed(f"{genre}|{plot}")
+        if vector is None:
+            return
+        with self._store_lock:
+            self.entries.append({
+                "filepath": str(filepath),
+                "embedding": vector.tolist()
+            })
+            self._matrix = None
+            self._save_index()
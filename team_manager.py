@@ -9,7 +9,9 @@ import json
 import importlib
 import asyncio
 import time
+from concurrency import get_model_limiter, get_request_semaphore, single_flight
 from config import config
+from llm_cache import expansion_cache_key, llm_cache
 from schemas import ExpandedPlotProposal, VotingResults
 from voting_strategies import VotingStrategyFactory
 
@@ -141,18 +143,29 @@ class TeamManager:
             }
         }
     
+    def _expansion_cache_key(self, team: Any, genre: str, plot: str) -> str:
+        """Cache key over everything that determines a team's expansion"""
+        return expansion_cache_key(team, genre, plot)
+
     def expand_plot(self, genre: str, plot: str) -> Dict[str, ExpandedPlotProposal]:
         """Have all teams expand the plot"""
         expansions = {}
-        
+
         for team_name, team in self.expansion_teams.items():
+            cache_key = self._expansion_cache_key(team, genre, plot)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                print(f"Team {team_name} expansion served from cache")
+                expansions[team_name] = ExpandedPlotProposal(**cached)
+                continue
             print(f"Team {team_name} is expanding the plot...")
             try:
-                expansion = team.expand_plot(genre, plot)
-                expansions[team_name] = expansion
+                # Successful invokes are cached by the team itself;
+                # fallback stubs returned on error must never persist
+                expansions[team_name] = team.expand_plot(genre, plot)
             except Exception as e:
                 print(f"Error in {team_name} expansion: {e}")
-        
+
         return expansions
     
     async def _retry_with_backoff(self, coro_func, team_name: str, *args, **kwargs):
@@ -198,25 +211,46 @@ class TeamManager:
     
     async def expand_plot_async(self, genre: str, plot: str) -> Dict[str, ExpandedPlotProposal]:
         """Parallel team expansion - all teams at once with retry logic"""
+        # Bound the fan-out so a large team roster doesn't breach
+        # provider rate limits (budget shared with voting and other plots)
+        semaphore = get_request_semaphore()
+
+        async def bounded(model_name, coro):
+            async with semaphore:
+                await get_model_limiter(model_name).acquire()
+                return await coro
+
+        expansions = {}
+        cache_keys = {}
         tasks = []
         for team_name, team in self.expansion_teams.items():
+            cache_key = self._expansion_cache_key(team, genre, plot)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                print(f"✓ {team_name} expansion served from cache")
+                expansions[team_name] = ExpandedPlotProposal(**cached)
+                continue
+            cache_keys[team_name] = cache_key
             # Check if team has async method, otherwise run sync in thread
             if hasattr(team, 'expand_plot_async'):
                 # Wrap async method with retry logic
-                task = self._retry_with_backoff(team.expand_plot_async, team_name, genre, plot)
+                make_call = (lambda team=team, team_name=team_name:
+                             self._retry_with_backoff(team.expand_plot_async, team_name, genre, plot))
             else:
                 # For sync methods, we can't retry as easily, just run in thread
-                task = asyncio.to_thread(team.expand_plot, genre, plot)
-            tasks.append((team_name, task))
+                make_call = lambda team=team: asyncio.to_thread(team.expand_plot, genre, plot)
+            # single_flight merges identical expansions already in flight
+            # (e.g. the same plot submitted twice in one catalog)
+            tasks.append((team_name,
+                          bounded(team.model_name, single_flight(cache_key, make_call))))
         
         # Run all teams in parallel
         print(f"Running {len(tasks)} teams in parallel...")
         results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
-        
+
         # Build expansions dict
-        expansions = {}
         fallback_count = 0
-        
+
         for (team_name, _), result in zip(tasks, results):
             if isinstance(result, Exception):
                 print(f"❌ {team_name} failed after retries: {result}")
@@ -225,6 +259,8 @@ class TeamManager:
                 if hasattr(team, 'expand_plot'):
                     try:
                         print(f"   Attempting sync fallback for {team_name}...")
+                        # The team caches this itself if (and only if)
+                        # the invoke genuinely succeeded
                         expansion = await asyncio.to_thread(team.expand_plot, genre, plot)
                         expansions[team_name] = expansion
                         print(f"   ✓ {team_name} sync fallback succeeded")
@@ -233,6 +269,7 @@ class TeamManager:
                         print(f"   ❌ {team_name} sync fallback also failed: {e2}")
             else:
                 expansions[team_name] = result
+                llm_cache.set(cache_keys[team_name], result.model_dump(mode="json"))
                 print(f"✓ {team_name} completed")
         
         if fallback_count > 0:
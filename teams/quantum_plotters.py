@@ -5,7 +5,8 @@ Quantum Plotters - Masters of intricate plotting and satisfying twists
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 from schemas import ExpandedPlotProposal, CharacterInfo, StoryBeats
-from config import config
+from model_cache import get_model, activate_fallback
+from llm_cache import expansion_cache_key, llm_cache
 
 
 class QuantumPlotters:
@@ -15,23 +16,16 @@ class QuantumPlotters:
         self.name = model_config.get("name", "Quantum Plotters")  # Support custom names
         self.model_name = model_config.get("model_name", "gpt-4o-mini-2024-07-18")
         self.temperature = model_config.get("temperature", 0.7)
+        # Static per-team prompt preamble; only genre/plot vary per call
+        self._creative_direction = """TEAM IDENTITY: You are Quantum Plotters - masters of interconnected, multi-layered narratives.
+Your strength lies in creating stories where every element connects in unexpected ways, like quantum entanglement.
+You excel at plots with hidden connections, parallel storylines that influence each other, and butterfly effects.
+AVOID: Simple cause-and-effect. Everything should connect in surprising ways."""
         self.model = self._initialize_model()
     
     def _initialize_model(self) -> ChatOpenAI:
-        """Initialize model with fallback support"""
-        try:
-            model = ChatOpenAI(model=self.model_name, temperature=self.temperature)
-            model.invoke("test")
-            return model
-        except:
-            fallback = config.get_model_fallback(self.model_name)
-            if fallback:
-                print(f"Using fallback model {fallback} for {self.name}")
-                self.model_name = fallback
-                return ChatOpenAI(model=fallback, temperature=self.temperature)
-            # Last resort
-            self.model_name = "gpt-4o-mini-2024-07-18"
-            return ChatOpenAI(model=self.model_name, temperature=self.temperature)
+        """Get the shared model instance (no live probe; see model_cache)"""
+        return get_model(self.model_name, self.temperature)
     
     def expand_plot(self, genre: str, plot: str) -> ExpandedPlotProposal:
         """Expand plot with Quantum Plotters approach"""
@@ -80,10 +74,16 @@ Remember to embody the Quantum Plotters team's mastery of intricate, satisfying
             expansion.model_used = self.model_name
             
             # Add any team-specific post-processing
-            return self._post_process_expansion(expansion)
+            expansion = self._post_process_expansion(expansion)
+            # Cache only real results; the error path below returns stubs
+            llm_cache.set(expansion_cache_key(self, genre, plot),
+                          expansion.model_dump(mode="json"))
+            return expansion
             
         except Exception as e:
             print(f"Error in {self.name} expansion: {e}")
+            if activate_fallback(self):
+                return self.expand_plot(genre, plot)
             return self._create_fallback_expansion(genre, plot)
     
     def _post_process_expansion(self, expansion: ExpandedPlotProposal) -> ExpandedPlotProposal:
@@ -97,20 +97,11 @@ Remember to embody the Quantum Plotters team's mastery of intricate, satisfying
             expansion.unique_hooks.append("Carefully planted revelations")
         return expansion
     
-    async def expand_plot_async(self, genre: str, plot: str) -> ExpandedPlotProposal:
-        """Async version - expand plot using ainvoke for parallel processing"""
-        # Team-specific creative direction
-        creative_direction = """TEAM IDENTITY: You are Quantum Plotters - masters of interconnected, multi-layered narratives.
-Your strength lies in creating stories where every element connects in unexpected ways, like quantum entanglement.
-You excel at plots with hidden connections, parallel storylines that influence each other, and butterfly effects.
-AVOID: Simple cause-and-effect. Everything should connect in surprising ways."""
-        
-        # Build expansion prompt
-        prompt = f"""{creative_direction}
+    def _build_prompt(self, genre: str, plot: str) -> str:
+        """Build the team's expansion prompt (async/batch wording)"""
+        prompt = f"""{self._creative_direction}
 
 Team: {self.name}
-Genre: {genre}
-Original Plot: {plot}
 
 As Quantum Plotters, create an intricately connected plot expansion.
 
@@ -128,8 +119,17 @@ Provide a complete story expansion with:
 - What makes this version unique (3-5 hooks)
 - Complexity rating from 1-10
 
-Remember to embody Quantum Plotters' interconnected approach."""
+Remember to embody Quantum Plotters' interconnected approach.
+
+Genre: {genre}
+Original Plot: {plot}"""
         
+        return prompt
+
+    async def expand_plot_async(self, genre: str, plot: str) -> ExpandedPlotProposal:
+        """Async version - expand plot using ainvoke for parallel processing"""
+        prompt = self._build_prompt(genre, plot)
+
         # Use structured output with async
         structured_model = self.model.with_structured_output(ExpandedPlotProposal)
         
@@ -2,15 +2,34 @@
 Base voter class that all voters inherit from
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Literal
+from functools import lru_cache
 from langchain_openai import ChatOpenAI
+from pydantic import Field, create_model
 from schemas import VotingResult, ExpandedPlotProposal
+from concurrency import single_flight
 from config import config
-import json
-import re
+from llm_cache import llm_cache
+from model_cache import get_model, activate_fallback
 import random
 
 
+@lru_cache(maxsize=32)
+def _ballot_schema(team_names: tuple):
+    """Vote schema with vote_for_team constrained to the actual teams
+
+    Structured output (function calling) enforces a valid team name at
+    the schema level, so votes can't land in the invalid-team or
+    JSON-parse fallback paths.
+    """
+    return create_model(
+        'VoteBallot',
+        vote_for_team=(Literal[team_names], Field(description="The ONE team you are voting for")),
+        reasoning=(str, Field(description="Why this choice aligns with YOUR specific perspective and biases")),
+        scores=(Dict[str, int], Field(default_factory=dict, description="1-10 rating per voting criterion")),
+    )
+
+
 class BaseVoter:
     """Base class for all voting agents"""
     
@@ -28,32 +47,19 @@ class BaseVoter:
             "expandability": 0.25
         })
         self.voting_bias = model_config.get("voting_bias", "balanced evaluation")
-        self.model = self._initialize_model()
-    
-    def _initialize_model(self) -> ChatOpenAI:
-        """Initialize model with fallback support"""
-        try:
-            model = ChatOpenAI(model=self.model_name, temperature=self.temperature)
-            model.invoke("test")
-            return model
-        except:
-            fallback = config.get_model_fallback(self.model_name)
-            if fallback:
-                print(f"Using fallback model {fallback} for {self.name}")
-                self.model_name = fallback
-                return ChatOpenAI(model=fallback, temperature=self.temperature)
-            # Last resort
-            self.model_name = "gpt-4o-mini-2024-07-18"
-            return ChatOpenAI(model=self.model_name, temperature=self.temperature)
-    
-    def vote(self, expansions: Dict[str, ExpandedPlotProposal]) -> VotingResult:
-        """Cast vote based on agent's unique perspective"""
-        
-        # Prepare expansions text
-        expansions_text = self._prepare_expansions_text(expansions)
-        
-        # Build voting prompt
-        prompt = f"""You are {self.name}.
+        # Replay mode: identical inputs reproduce identical ballots, so
+        # repeat evaluations hit the disk and provider caches exactly
+        if config.get_system_config("deterministic_voting", False):
+            self.temperature = 0.0
+            self.seed = 42
+        else:
+            self.seed = None
+        # The criteria section of the voting prompt derives only from
+        # the fixed weights, so render it once instead of per vote
+        self._criteria_prompt = self._build_criteria_prompt()
+        # Likewise the prompt header/footer derive only from init-time
+        # config; only the expansions text varies per vote
+        self._vote_prompt_header = f"""You are {self.name}.
 
 {self.system_prompt}
 
@@ -63,102 +69,166 @@ IMPORTANT VOTING GUIDANCE:
 - It's GOOD to disagree with what others might choose. The council needs diverse opinions.
 - Trust your instincts and professional judgment, even if it goes against conventional wisdom.
 
-Here are all the plot expansions to evaluate (presented in random order):
-{expansions_text}
-
-Your voting criteria and personal weights (these reflect YOUR priorities, not universal standards):
-- Originality ({self.criteria_weights.get('originality', 0.15)*100:.0f}%): How unique and fresh is the concept?
-- Coherence ({self.criteria_weights.get('coherence', 0.15)*100:.0f}%): How well does the plot hold together?
-- Market Potential ({self.criteria_weights.get('market_potential', 0.15)*100:.0f}%): Will readers want to read this?
-- Character Depth ({self.criteria_weights.get('character_depth', 0.15)*100:.0f}%): Are the characters compelling?
-- Thematic Richness ({self.criteria_weights.get('thematic_richness', 0.15)*100:.0f}%): Does it explore meaningful themes?
-- Expandability ({self.criteria_weights.get('expandability', 0.15)*100:.0f}%): Can this sustain a 100k+ word novel?
-
-Remember: Your weights show what YOU value most. A {self.criteria_weights.get('character_depth', 0.15)*100:.0f}% weight on character depth means that's how much it matters to YOU specifically.
-
-Please evaluate all expansions and vote for the best one according to YOUR perspective.
+{self._criteria_prompt}
 
-You MUST respond in the following JSON format:
-{{
-  "vote_for_team": "Team Name Here",
-  "reasoning": "Your detailed reasoning here, explaining why THIS choice aligns with YOUR specific perspective and biases",
-  "scores": {{
-    "originality": 8,
-    "coherence": 7,
-    "market_potential": 6,
-    "character_depth": 8,
-    "thematic_richness": 7,
-    "expandability": 8
-  }}
-}}
+Here are all the plot expansions to evaluate (presented in random order):"""
+        self._vote_prompt_footer = f"""Please evaluate all expansions and vote for the best one according to YOUR perspective.
 
 Important:
 - Choose ONE team from the expansions above
 - Your reasoning should reflect YOUR unique perspective as {self.name}
 - Don't try to be "fair" or "balanced" - be true to your role
-- Rate each criterion from 1-10 based on YOUR standards
-- Your response must be valid JSON only"""
-        
+- Rate each criterion (originality, coherence, market_potential, character_depth, thematic_richness, expandability) from 1-10 based on YOUR standards"""
+        self.model = self._initialize_model()
+
+    def _build_criteria_prompt(self) -> str:
+        """Render the static criteria/weights section of the voting prompt"""
+        weight = self.criteria_weights.get
+        return f"""Your voting criteria and personal weights (these reflect YOUR priorities, not universal standards):
+- Originality ({weight('originality', 0.15)*100:.0f}%): How unique and fresh is the concept?
+- Coherence ({weight('coherence', 0.15)*100:.0f}%): How well does the plot hold together?
+- Market Potential ({weight('market_potential', 0.15)*100:.0f}%): Will readers want to read this?
+- Character Depth ({weight('character_depth', 0.15)*100:.0f}%): Are the characters compelling?
+- Thematic Richness ({weight('thematic_richness', 0.15)*100:.0f}%): Does it explore meaningful themes?
+- Expandability ({weight('expandability', 0.15)*100:.0f}%): Can this sustain a 100k+ word novel?
+
+Remember: Your weights show what YOU value most. A {weight('character_depth', 0.15)*100:.0f}% weight on character depth means that's how much it matters to YOU specifically."""
+    
+    def _initialize_model(self) -> ChatOpenAI:
+        """Get the shared model instance (no live probe; see model_cache)"""
+        return get_model(self.model_name, self.temperature, self.seed)
+    
+    def build_vote_prompt(self,
+                          expansions: Dict[str, ExpandedPlotProposal],
+                          expansion_blocks: Dict[str, str] = None) -> str:
+        """Build this voter's full prompt (also used by the batch runner)"""
+        # Prepare expansions text (blocks may be pre-formatted by the strategy)
+        expansions_text = self._prepare_expansions_text(expansions, expansion_blocks)
+
+        return f"{self._vote_prompt_header}\n{expansions_text}\n\n{self._vote_prompt_footer}"
+
+    def vote(self,
+             expansions: Dict[str, ExpandedPlotProposal],
+             expansion_blocks: Dict[str, str] = None) -> VotingResult:
+        """Cast vote based on agent's unique perspective"""
+        prompt = self.build_vote_prompt(expansions, expansion_blocks)
+        ballot_schema = _ballot_schema(tuple(sorted(expansions.keys())))
+
         try:
-            # Get vote
-            response = self.model.invoke(prompt)
-            vote_data = self._parse_vote_response(response.content)
-            
+            # Get vote (served from the disk cache on repeated inputs)
+            cache_key = self._vote_cache_key(expansions)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                ballot = ballot_schema(**cached)
+            else:
+                voting_model = self.model.with_structured_output(ballot_schema)
+                ballot = voting_model.invoke(prompt)
+                llm_cache.set(cache_key, ballot.model_dump(mode="json"))
+
             return VotingResult(
                 agent_name=self.name,
                 model_used=self.model_name,
-                vote_for_team=self._clean_team_name(vote_data["vote_for_team"]),
-                reasoning=vote_data["reasoning"],
-                score_breakdown=vote_data.get("scores", {})
+                vote_for_team=ballot.vote_for_team,
+                reasoning=ballot.reasoning,
+                score_breakdown=ballot.scores
             )
             
         except Exception as e:
             print(f"Error in {self.name} voting: {e}")
+            if activate_fallback(self):
+                return self.vote(expansions, expansion_blocks)
             return self._create_fallback_vote(expansions)
     
-    def _prepare_expansions_text(self, expansions: Dict[str, ExpandedPlotProposal]) -> str:
+    def _vote_cache_key(self, expansions: Dict[str, ExpandedPlotProposal]) -> str:
+        """Cache key over the vote's deterministic inputs
+
+        The rendered prompt shuffles team order, so key on the sorted
+        expansion contents instead of the prompt text itself.
+        """
+        return llm_cache.make_key(
+            self.name, self.model_name, self.temperature,
+            sorted((team, expansions[team].model_dump()) for team in expansions),
+            "VotingResult"
+        )
+
+    @staticmethod
+    def _format_expansion_block(team_name: str, expansion: ExpandedPlotProposal) -> str:
+        """Format one team's expansion for the voting prompt"""
+        parts = [
+            f"\n{'='*60}\n",
+            f"TEAM: {team_name}\n",
+            f"Title: {expansion.title}\n",
+            f"Logline: {expansion.logline}\n\n",
+            "Main Characters:\n"
+        ]
+        for char in expansion.main_characters[:3]:  # Limit to 3
+            parts.append(f"- {char.name} ({char.role}): {char.description}\n")
+
+        parts.append(f"\nPlot Summary:\n{expansion.plot_summary}\n\n")
+        parts.append(f"Central Conflict: {expansion.central_conflict}\n\n")
+
+        # Story beats
+        parts.append("Story Beats:\n")
+        parts.append(f"- Opening: {expansion.story_beats.opening}\n")
+        parts.append(f"- Catalyst: {expansion.story_beats.catalyst}\n")
+        parts.append(f"- Midpoint: {expansion.story_beats.midpoint}\n")
+        parts.append(f"- Crisis: {expansion.story_beats.crisis}\n")
+        parts.append(f"- Resolution: {expansion.story_beats.resolution}\n\n")
+
+        parts.append(f"Ending: {expansion.ending}\n\n")
+        parts.append(f"Key Elements: {', '.join(expansion.key_elements)}\n")
+        parts.append(f"Themes: {', '.join(expansion.themes)}\n")
+        parts.append(f"Unique Hooks: {', '.join(expansion.unique_hooks)}\n")
+        parts.append(f"Complexity: {expansion.estimated_complexity}/10\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _format_expansion_compact(team_name: str, expansion: ExpandedPlotProposal) -> str:
+        """Compact block for voting prompts - drops the 300-400 word
+        summary, characters, conflict and ending, keeping the beats and
+        hooks (roughly a 4x input-token cut per team per voter)"""
+        beats = expansion.story_beats
+        return (
+            f"\n{'='*60}\n"
+            f"TEAM: {team_name}\n"
+            f"Title: {expansion.title}\n"
+            f"Logline: {expansion.logline}\n\n"
+            "Story Beats:\n"
+            f"- Opening: {beats.opening}\n"
+            f"- Catalyst: {beats.catalyst}\n"
+            f"- Midpoint: {beats.midpoint}\n"
+            f"- Crisis: {beats.crisis}\n"
+            f"- Resolution: {beats.resolution}\n\n"
+            f"Key Elements: {', '.join(expansion.key_elements)}\n"
+            f"Themes: {', '.join(expansion.themes)}\n"
+            f"Unique Hooks: {', '.join(expansion.unique_hooks)}\n"
+            f"Complexity: {expansion.estimated_complexity}/10\n"
+        )
+
+    @classmethod
+    def format_expansion_blocks(cls, expansions: Dict[str, ExpandedPlotProposal]) -> Dict[str, str]:
+        """Pre-format all team blocks once so a voting round can share them
+
+        Every voter in a round formats the same expansions; strategies
+        can compute the blocks once and hand them to each vote() call,
+        leaving only the cheap per-voter shuffle. Blocks are compact by
+        default; set compact_voting_prompts false for the full detail.
+        """
+        formatter = (cls._format_expansion_compact
+                     if config.get_system_config("compact_voting_prompts", True)
+                     else cls._format_expansion_block)
+        return {team: formatter(team, expansion)
+                for team, expansion in expansions.items()}
+
+    def _prepare_expansions_text(self,
+                                 expansions: Dict[str, ExpandedPlotProposal],
+                                 blocks: Dict[str, str] = None) -> str:
         """Format expansions for voting"""
+        if blocks is None:
+            blocks = self.format_expansion_blocks(expansions)
         team_order = list(expansions.keys())
         random.shuffle(team_order)  # Randomize to avoid bias
-        
-        text = ""
-        for team_name in team_order:
-            expansion = expansions[team_name]
-            text += f"\n{'='*60}\n"
-            text += f"TEAM: {team_name}\n"
-            text += f"Title: {expansion.title}\n"
-            text += f"Logline: {expansion.logline}\n\n"
-            
-            # Characters
-            text += f"Main Characters:\n"
-            for char in expansion.main_characters[:3]:  # Limit to 3
-                text += f"- {char.name} ({char.role}): {char.description}\n"
-            
-            text += f"\nPlot Summary:\n{expansion.plot_summary}\n\n"
-            text += f"Central Conflict: {expansion.central_conflict}\n\n"
-            
-            # Story beats
-            text += f"Story Beats:\n"
-            text += f"- Opening: {expansion.story_beats.opening}\n"
-            text += f"- Catalyst: {expansion.story_beats.catalyst}\n"
-            text += f"- Midpoint: {expansion.story_beats.midpoint}\n"
-            text += f"- Crisis: {expansion.story_beats.crisis}\n"
-            text += f"- Resolution: {expansion.story_beats.resolution}\n\n"
-            
-            text += f"Ending: {expansion.ending}\n\n"
-            text += f"Key Elements: {', '.join(expansion.key_elements)}\n"
-            text += f"Themes: {', '.join(expansion.themes)}\n"
-            text += f"Unique Hooks: {', '.join(expansion.unique_hooks)}\n"
-            text += f"Complexity: {expansion.estimated_complexity}/10\n"
-        
-        return text
-    
-    def _parse_vote_response(self, response: str) -> Dict[str, Any]:
-        """Parse JSON response from model"""
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group())
-        raise ValueError("No valid JSON found in response")
+        return "".join(blocks[team_name] for team_name in team_order)
     
     def _clean_team_name(self, team_name: str) -> str:
         """Clean team name from response"""
@@ -168,70 +238,34 @@ Important:
             return team_name[6:]
         return team_name
     
-    async def vote_async(self, expansions: Dict[str, ExpandedPlotProposal]) -> VotingResult:
+    async def vote_async(self,
+                         expansions: Dict[str, ExpandedPlotProposal],
+                         expansion_blocks: Dict[str, str] = None) -> VotingResult:
         """Async version - cast vote using ainvoke for parallel processing"""
-        
-        # Prepare expansions text
-        expansions_text = self._prepare_expansions_text(expansions)
-        
-        # Build voting prompt (same as sync version)
-        prompt = f"""You are {self.name}.
-
-{self.system_prompt}
-
-IMPORTANT VOTING GUIDANCE:
-- As {self.name}, you have a unique perspective: {self.voting_bias}
-- Don't simply choose what seems "best overall" - vote based on YOUR specific expertise and biases
-- It's GOOD to disagree with what others might choose. The council needs diverse opinions.
-- Trust your instincts and professional judgment, even if it goes against conventional wisdom.
-
-Here are all the plot expansions to evaluate (presented in random order):
-{expansions_text}
-
-Your voting criteria and personal weights (these reflect YOUR priorities, not universal standards):
-- Originality ({self.criteria_weights.get('originality', 0.15)*100:.0f}%): How unique and fresh is the concept?
-- Coherence ({self.criteria_weights.get('coherence', 0.15)*100:.0f}%): How well does the plot hold together?
-- Market Potential ({self.criteria_weights.get('market_potential', 0.15)*100:.0f}%): Will readers want to read this?
-- Character Depth ({self.criteria_weights.get('character_depth', 0.15)*100:.0f}%): Are the characters compelling?
-- Thematic Richness ({self.criteria_weights.get('thematic_richness', 0.15)*100:.0f}%): Does it explore meaningful themes?
-- Expandability ({self.criteria_weights.get('expandability', 0.15)*100:.0f}%): Can this sustain a 100k+ word novel?
-
-Remember: Your weights show what YOU value most. A {self.criteria_weights.get('character_depth', 0.15)*100:.0f}% weight on character depth means that's how much it matters to YOU specifically.
-
-Please evaluate all expansions and vote for the best one according to YOUR perspective.
+        prompt = self.build_vote_prompt(expansions, expansion_blocks)
+        ballot_schema = _ballot_schema(tuple(sorted(expansions.keys())))
 
-You MUST respond in the following JSON format:
-{{
-  "vote_for_team": "Team Name Here",
-  "reasoning": "Your detailed reasoning here, explaining why THIS choice aligns with YOUR specific perspective and biases",
-  "scores": {{
-    "originality": 8,
-    "coherence": 7,
-    "market_potential": 6,
-    "character_depth": 8,
-    "thematic_richness": 7,
-    "expandability": 8
-  }}
-}}
-
-Important:
-- Choose ONE team from the expansions above
-- Your reasoning should reflect YOUR unique perspective as {self.name}
-- Don't try to be "fair" or "balanced" - be true to your role
-- Rate each criterion from 1-10 based on YOUR standards
-- Your response must be valid JSON only"""
-        
         try:
-            # Get vote using async
-            response = await self.model.ainvoke(prompt)
-            vote_data = self._parse_vote_response(response.content)
-            
+            # Get vote using async (served from the disk cache on repeated inputs)
+            cache_key = self._vote_cache_key(expansions)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                ballot = ballot_schema(**cached)
+            else:
+                async def _cast_ballot():
+                    voting_model = self.model.with_structured_output(ballot_schema)
+                    result = await voting_model.ainvoke(prompt)
+                    llm_cache.set(cache_key, result.model_dump(mode="json"))
+                    return result
+                # single_flight merges duplicate ballots already in flight
+                ballot = await single_flight(cache_key, _cast_ballot)
+
             return VotingResult(
                 agent_name=self.name,
                 model_used=self.model_name,
-                vote_for_team=self._clean_team_name(vote_data["vote_for_team"]),
-                reasoning=vote_data["reasoning"],
-                score_breakdown=vote_data.get("scores", {})
+                vote_for_team=ballot.vote_for_team,
+                reasoning=ballot.reasoning,
+                score_breakdown=ballot.scores
             )
             
         except Exception as e:
@@ -5,10 +5,46 @@ Pluggable voting implementations to allow future improvements
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any
-from schemas import ExpandedPlotProposal, VotingResults, VotingResult
+from pydantic_core import from_json
+from schemas import CRITERIA, ExpandedPlotProposal, VotingResults, VotingResult
+from concurrency import get_model_limiter, get_request_semaphore
 from collections import defaultdict
 import asyncio
 
+import numpy as np
+
+
+def _extract_json_array(text: str) -> str:
+    """Return the first top-level JSON array in text, or None
+
+    O(n) bracket scan (string-literal aware). The greedy
+    re.search(r'[.*]', DOTALL) it replaces backtracks badly on long
+    or malformed responses and can match the wrong bracket span.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '[':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == ']' and depth:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
 
 class VotingStrategy(ABC):
     """Abstract base class for voting strategies"""
@@ -36,24 +72,44 @@ class StandardVoting(VotingStrategy):
         except Exception as e:
             print(f"Async voting not available ({e}), using standard voting...")
             return self._conduct_voting_sync(expansions, voting_agents)
-    
-    async def _conduct_voting_async(self, 
+
+    async def conduct_voting_async(self,
+                                   expansions: Dict[str, ExpandedPlotProposal],
+                                   voting_agents: List[Any]) -> VotingResults:
+        """Async entry point used by TeamManager.conduct_voting_async"""
+        return await self._conduct_voting_async(expansions, voting_agents)
+
+    async def _conduct_voting_async(self,
                                    expansions: Dict[str, ExpandedPlotProposal], 
                                    voting_agents: List[Any]) -> VotingResults:
         """Async version - conduct voting in parallel"""
         
         vote_tally = {team_name: 0 for team_name in expansions.keys()}
-        
+
+        # Bound the fan-out so a large council doesn't breach provider
+        # rate limits (budget shared with expansion and other plots)
+        semaphore = get_request_semaphore()
+
+        async def bounded(model_name, coro):
+            async with semaphore:
+                await get_model_limiter(model_name).acquire()
+                return await coro
+
+        # Format the per-team blocks once; each voter only shuffles them
+        expansion_blocks = None
+        if voting_agents and hasattr(voting_agents[0], 'format_expansion_blocks'):
+            expansion_blocks = voting_agents[0].format_expansion_blocks(expansions)
+
         # Prepare voting tasks
         print(f"\nCollecting votes from {len(voting_agents)} agents (async parallel)...")
         tasks = []
         for i, agent in enumerate(voting_agents, 1):
             if hasattr(agent, 'vote_async'):
-                task = agent.vote_async(expansions)
+                task = agent.vote_async(expansions, expansion_blocks)
             else:
                 # Fallback to sync in thread
-                task = asyncio.to_thread(agent.vote, expansions)
-            tasks.append((i, agent.name, task))
+                task = asyncio.to_thread(agent.vote, expansions, expansion_blocks)
+            tasks.append((i, agent.name, bounded(agent.model_name, task)))
         
         # Execute all voting tasks in parallel
         results = await asyncio.gather(*[task for _, _, task in tasks], return_exceptions=True)
@@ -101,13 +157,18 @@ class StandardVoting(VotingStrategy):
         
         votes = []
         vote_tally = {team_name: 0 for team_name in expansions.keys()}
-        
+
+        # Format the per-team blocks once; each voter only shuffles them
+        expansion_blocks = None
+        if voting_agents and hasattr(voting_agents[0], 'format_expansion_blocks'):
+            expansion_blocks = voting_agents[0].format_expansion_blocks(expansions)
+
         # Collect votes from all agents
         print(f"\nCollecting votes from {len(voting_agents)} agents...")
         for i, agent in enumerate(voting_agents, 1):
             try:
                 print(f"  [{i}/{len(voting_agents)}] {agent.name} is voting...")
-                vote = agent.vote(expansions)
+                vote = agent.vote(expansions, expansion_blocks)
                 if vote.vote_for_team in vote_tally:
                     vote_tally[vote.vote_for_team] += 1
                     votes.append(vote)
@@ -144,7 +205,7 @@ class StandardVoting(VotingStrategy):
         team_scores = {team: 0 for team in tied_teams}
         for vote in votes:
             if vote.vote_for_team in tied_teams:
-                team_scores[vote.vote_for_team] += sum(vote.score_breakdown.values())
+                team_scores[vote.vote_for_team] += sum(vote.score_breakdown)
         return max(team_scores, key=team_scores.get)
     
     def _generate_voting_summary(self, votes: List[VotingResult], vote_tally: Dict[str, int], 
@@ -154,49 +215,61 @@ class StandardVoting(VotingStrategy):
         # Vote distribution
         vote_distribution = dict(sorted(vote_tally.items(), key=lambda x: x[1], reverse=True))
         
-        # Agent-by-agent breakdown
+        # Stack every vote's scores into one (n_votes, n_criteria) int8
+        # array; score_breakdown is already fixed-width in CRITERIA
+        # order, so the stats below are pure C-level reductions
+        criteria_names = list(CRITERIA)
+        n_votes, n_criteria = len(votes), len(criteria_names)
+        scores_arr = np.zeros((n_votes, n_criteria), dtype=np.int8)
+        for i, vote in enumerate(votes):
+            row = vote.score_breakdown[:n_criteria]
+            scores_arr[i, :len(row)] = row
+
+        # Agent-by-agent breakdown and model preferences (single pass)
         agent_votes = {}
-        for vote in votes:
+        model_preferences = defaultdict(lambda: defaultdict(int))
+        for i, vote in enumerate(votes):
             agent_votes[vote.agent_name] = {
                 "voted_for": vote.vote_for_team,
                 "model_used": vote.model_used,
-                "total_score": sum(vote.score_breakdown.values())
+                "total_score": int(scores_arr[i].sum())
             }
-        
+            model_preferences[vote.model_used][vote.vote_for_team] += 1
+
         # Team average scores
-        team_scores_detail = defaultdict(lambda: defaultdict(list))
-        for vote in votes:
+        team_order = []
+        team_rows = []
+        row_team_idx = []
+        for i, vote in enumerate(votes):
             if vote.vote_for_team in expanded_plots:
-                for criterion, score in vote.score_breakdown.items():
-                    team_scores_detail[vote.vote_for_team][criterion].append(score)
-        
-        # Calculate averages
+                if vote.vote_for_team not in team_order:
+                    team_order.append(vote.vote_for_team)
+                row_team_idx.append(team_order.index(vote.vote_for_team))
+                team_rows.append(i)
+
         team_avg_scores = {}
-        for team, criteria_scores in team_scores_detail.items():
-            team_avg_scores[team] = {}
-            for criterion, scores in criteria_scores.items():
-                team_avg_scores[team][criterion] = round(sum(scores) / len(scores), 1) if scores else 0
-            # Add total average
-            all_scores = [score for scores in criteria_scores.values() for score in scores]
-            team_avg_scores[team]["total_avg"] = round(sum(all_scores) / len(all_scores), 1) if all_scores else 0
-        
-        # Voting patterns
-        model_preferences = defaultdict(lambda: defaultdict(int))
-        criteria_scores_all = defaultdict(list)
-        
-        for vote in votes:
-            model_preferences[vote.model_used][vote.vote_for_team] += 1
-            for criterion, score in vote.score_breakdown.items():
-                criteria_scores_all[criterion].append(score)
-        
-        # Find unanimous and divisive criteria
+        if team_rows:
+            sums = np.zeros((len(team_order), n_criteria), dtype=np.int64)
+            vote_counts = np.zeros(len(team_order), dtype=np.int64)
+            np.add.at(sums, row_team_idx, scores_arr[team_rows].astype(np.int64))
+            np.add.at(vote_counts, row_team_idx, 1)
+            for t, team in enumerate(team_order):
+                entry = {
+                    criterion: round(float(sums[t, j]) / vote_counts[t], 1)
+                    for j, criterion in enumerate(criteria_names)
+                }
+                entry["total_avg"] = round(float(sums[t].sum()) / (vote_counts[t] * n_criteria), 1)
+                team_avg_scores[team] = entry
+
+        # Find unanimous and divisive criteria (population variance)
         criteria_variance = {}
-        for criterion, scores in criteria_scores_all.items():
-            if scores:
-                avg = sum(scores) / len(scores)
-                variance = sum((s - avg) ** 2 for s in scores) / len(scores)
-                criteria_variance[criterion] = variance
-        
+        if n_votes:
+            variances = scores_arr.astype(np.float64).var(axis=0)
+            criteria_variance = {
+                criterion: float(variances[j])
+                for j, criterion in enumerate(criteria_names)
+            }
+
         sorted_criteria = sorted(criteria_variance.items(), key=lambda x: x[1])
         unanimous_criteria = [c[0] for c in sorted_criteria[:2]] if len(sorted_criteria) >= 2 else []
         divisive_criteria = [c[0] for c in sorted_criteria[-2:]] if len(sorted_criteria) >= 2 else []
@@ -217,6 +290,169 @@ class StandardVoting(VotingStrategy):
         }
 
 
+class BatchedVoting(StandardVoting):
+    """Row-marshaled voting - one call per model covers all its agents
+
+    Agents that share a model differ only by persona and weights, so
+    their votes can be collected from a single prompt asking the model
+    to role-play each member and emit one JSON array of votes. Cuts
+    network round-trips from one per agent to one per model group.
+    """
+
+    max_group_size = 4  # keep batches in the sweet spot before per-call latency inflates
+
+    def conduct_voting(self,
+                      expansions: Dict[str, ExpandedPlotProposal],
+                      voting_agents: List[Any]) -> VotingResults:
+        """Each agent votes once, but calls are batched per model"""
+        try:
+            return asyncio.run(self._conduct_batched_async(expansions, voting_agents))
+        except Exception as e:
+            print(f"Batched voting not available ({e}), using standard voting...")
+            return self._conduct_voting_sync(expansions, voting_agents)
+
+    async def conduct_voting_async(self,
+                                   expansions: Dict[str, ExpandedPlotProposal],
+                                   voting_agents: List[Any]) -> VotingResults:
+        """Async entry point - keeps batching instead of degrading to
+        the inherited per-agent standard voting"""
+        return await self._conduct_batched_async(expansions, voting_agents)
+
+    async def _conduct_batched_async(self,
+                                     expansions: Dict[str, ExpandedPlotProposal],
+                                     voting_agents: List[Any]) -> VotingResults:
+        """Group agents by model, one prompt per group, demux the votes"""
+        vote_tally = {team_name: 0 for team_name in expansions.keys()}
+
+        # Group agents by model and cap group size
+        groups = defaultdict(list)
+        for agent in voting_agents:
+            groups[agent.model_name].append(agent)
+
+        batches = []
+        for agents in groups.values():
+            for start in range(0, len(agents), self.max_group_size):
+                batches.append(agents[start:start + self.max_group_size])
+
+        semaphore = get_request_semaphore()
+
+        async def one_batch(agents):
+            async with semaphore:
+                await get_model_limiter(agents[0].model_name).acquire()
+                prompt = self._build_batch_prompt(agents, expansions)
+                response = await agents[0].model.ainvoke(prompt)
+                return self._parse_batch_votes(response.content, agents)
+
+        print(f"\nCollecting votes from {len(voting_agents)} agents "
+              f"in {len(batches)} batched calls...")
+        results = await asyncio.gather(*[one_batch(agents) for agents in batches],
+                                       return_exceptions=True)
+
+        votes = []
+        for agents, result in zip(batches, results):
+            if isinstance(result, Exception):
+                print(f"    ❌ Batched vote failed for {[a.name for a in agents]}: {result}")
+                continue
+            for vote in result:
+                if vote.vote_for_team in vote_tally:
+                    vote_tally[vote.vote_for_team] += 1
+                    votes.append(vote)
+                    print(f"    ✓ {vote.agent_name} voted for: {vote.vote_for_team}")
+                else:
+                    print(f"    ⚠ {vote.agent_name} voted for invalid team: {vote.vote_for_team}")
+                    print(f"      Valid teams: {list(vote_tally.keys())}")
+
+        print(f"  Collected {len(votes)} votes successfully")
+
+        # Determine winner
+        winning_team = max(vote_tally, key=vote_tally.get)
+
+        # Handle ties by looking at total scores
+        tied_teams = [team for team, count in vote_tally.items() if count == vote_tally[winning_team]]
+        if len(tied_teams) > 1:
+            winning_team = self._break_tie(tied_teams, votes)
+
+        # Generate voting summary
+        voting_summary = self._generate_voting_summary(votes, vote_tally, expansions)
+
+        return VotingResults(
+            individual_votes=votes,
+            vote_tally=vote_tally,
+            winning_team=winning_team,
+            total_votes=len(votes),
+            voting_summary=voting_summary
+        )
+
+    def _build_batch_prompt(self,
+                            agents: List[Any],
+                            expansions: Dict[str, ExpandedPlotProposal]) -> str:
+        """Build one prompt covering every council member in the group"""
+        expansions_text = agents[0]._prepare_expansions_text(expansions)
+
+        member_blocks = []
+        for i, agent in enumerate(agents, 1):
+            weights = ", ".join(f"{k}: {v:.2f}" for k, v in agent.criteria_weights.items())
+            member_blocks.append(f"""Member {i}: {agent.name}
+Persona: {agent.system_prompt}
+Perspective: {agent.voting_bias}
+Criteria weights: {weights}""")
+        members_text = "\n\n".join(member_blocks)
+
+        return f"""You will role-play {len(agents)} voting council members evaluating plot expansions.
+Each member votes independently according to their OWN persona, perspective and weights.
+Members should disagree where their priorities genuinely differ.
+
+COUNCIL MEMBERS:
+{members_text}
+
+Here are all the plot expansions to evaluate (presented in random order):
+{expansions_text}
+
+You MUST respond with a JSON array containing exactly {len(agents)} vote objects,
+one per member, in the order the members are listed above:
+[
+  {{
+    "agent_name": "Member Name Here",
+    "vote_for_team": "Team Name Here",
+    "reasoning": "Why THIS member's perspective leads to this choice",
+    "scores": {{
+      "originality": 8,
+      "coherence": 7,
+      "market_potential": 6,
+      "character_depth": 8,
+      "thematic_richness": 7,
+      "expandability": 8
+    }}
+  }}
+]
+
+Important:
+- One vote object per member, in order
+- Each vote_for_team must be ONE team from the expansions above
+- Rate each criterion from 1-10 from that member's standpoint
+- Your response must be valid JSON only"""
+
+    def _parse_batch_votes(self, response: str, agents: List[Any]) -> List[VotingResult]:
+        """Demux the returned JSON array back into per-agent votes"""
+        json_array = _extract_json_array(response)
+        if json_array is None:
+            raise ValueError("No valid JSON array found in batched response")
+        # Rust-side parse; tolerates a truncated trailing vote object
+        entries = from_json(json_array, allow_partial=True)
+
+        votes = []
+        for agent, entry in zip(agents, entries):
+            vote_for_team = agent._clean_team_name(entry["vote_for_team"])
+            votes.append(VotingResult(
+                agent_name=agent.name,  # trust the roster, not the model's echo
+                model_used=agent.model_name,
+                vote_for_team=vote_for_team,
+                reasoning=entry.get("reasoning", ""),
+                score_breakdown=entry.get("scores", {})
+            ))
+        return votes
+
+
 class RankedChoiceVoting(VotingStrategy):
     """Ranked choice voting strategy (future implementation)"""
     
@@ -249,6 +485,7 @@ class VotingStrategyFactory:
     
     _strategies = {
         "standard": StandardVoting,
+        "batched": BatchedVoting,
         "ranked_choice": RankedChoiceVoting,
         "weighted": WeightedVoting
     }